@@ -1,23 +1,32 @@
 import io
 import tkinter as tk
 import random
-import re
 import os
-import webbrowser
-import requests
 from tkinter import simpledialog, messagebox
-from PIL import Image, ImageTk, ImageFile
-import json
 import time
 import sys
 
-# Allow loading truncated/corrupted images
-ImageFile.LOAD_TRUNCATED_IMAGES = True
-
 # Import sub-modules
+# PIL, requests (via utils.http_client), webbrowser et le décodage d'images
+# (utils.image_decode, utils.image_providers) ne sont importés qu'à leur première
+# utilisation : ils ne retardent pas l'ouverture de la fenêtre
+from utils.startup_timing import startup_phase, startup_report
 from utils.resource_utils import resource_path
-from utils.text_utils import shuffle_preserving_punctuation
-from utils.wikipedia_utils import fetch_wikipedia_image, load_gif_animation
+from utils.wikipedia_utils import resolve_image_urls, WIKIPEDIA_API_URL
+from utils.image_pack import get_image_pack
+from utils.image_worker import ImageFetchWorker, raise_if_cancelled
+from utils.http_client import close_session, host_available
+from utils.image_prefetch import SubthemePrefetcher
+from utils.image_cache import (
+    DiskImageCache, MemoryImageCache, get_image_cache, set_image_cache, normalize_term, photo_nbytes, image_nbytes
+)
+from utils.display_size import DISPLAY_MAX_SIZE, DISPLAY_SIZE_TIERS, display_size_for
+from utils.gif_stream import GifFrameStream, END_OF_STREAM
+from utils.frame_pool import shutdown_frame_pool
+from utils.photo_pool import PhotoPool
+from utils.word_staging import StagedWord, pick_word, display_letters
+from utils.icon_atlas import ICON_ATLAS_FILE, load_icon_atlas
+from utils.resource_utils import user_data_path
 from ui.theme_frame import ThemeFrame
 from ui.main_frame import MainFrame
 from ui.advanced_frame import AdvancedFrame
@@ -37,6 +46,35 @@ ICON_PATH = "assets"  # Les icônes sont directement dans le dossier assets
 GIF_PATH = "assets"   # Les GIFs sont aussi dans le dossier assets
 DATA_PATH = "data"
 
+# Taille maximale du cache disque des images (en Mo)
+IMAGE_CACHE_MAX_MB = 200
+
+# Durée pendant laquelle un terme sans image n'est pas recherché à nouveau (en jours)
+IMAGE_NEGATIVE_TTL_DAYS = 7
+
+# Budget mémoire des images déjà décodées (en Mo)
+IMAGE_MEMORY_CACHE_MB = 64
+
+# PhotoImage libres gardées pour être réutilisées (images et frames de GIF)
+PHOTO_POOL_SIZE = 8
+
+# Préchargement des images du sous-thème : téléchargements simultanés et nombre de mots
+PREFETCH_CONCURRENCY = 2
+PREFETCH_DEPTH = 30
+
+# Animations GIF : PhotoImage préparées en avance pendant la lecture
+GIF_FRAME_WINDOW = 8
+# Mémoire (en Mo, 4 octets par pixel) des frames d'un GIF gardées au plus ;
+# au-delà, les frames déjà jouées sont libérées
+GIF_MAX_KEPT_MB = 24
+# Attente avant de réessayer quand la frame suivante n'est pas encore décodée (en ms)
+GIF_UNDERRUN_DELAY = 10
+# Retard (en s) au-delà duquel l'animation repart de maintenant au lieu de rattraper
+GIF_MAX_LAG = 1.0
+
+# Délai après le dernier redimensionnement de la zone d'image avant de recalculer sa taille (en ms)
+IMAGE_RESIZE_DEBOUNCE_MS = 250
+
 def debug_log(*args):
     """Displays debug messages if DEBUG is True."""
     if DEBUG:
@@ -44,92 +82,228 @@ def debug_log(*args):
 
 
 class GifAnimator:
-    def __init__(self, parent, label):
+    """
+    Anime un GIF dans un label.
+
+    Les frames sont soit toutes prêtes (use_photos, cache mémoire), soit
+    décodées au fil de la lecture par un GifFrameStream : la première frame
+    s'affiche dès qu'elle est décodée et au plus 'window' PhotoImage sont
+    préparées en avance. Si ses frames occupent plus de GIF_MAX_KEPT_MB, celles
+    déjà jouées sont libérées et le GIF est décodé à nouveau à chaque boucle.
+
+    Chaque frame a une échéance sur une horloge monotone : un retard du thread Tk
+    fait sauter des frames au lieu de décaler toute l'animation. La lecture se
+    met en pause quand le label n'est pas visible (fenêtre réduite...).
+    """
+
+    def __init__(self, parent, label, photo_cache=None, photo_pool=None, window=GIF_FRAME_WINDOW):
         self.parent = parent
         self.label = label
+        self.photo_cache = photo_cache
+        self.photo_pool = photo_pool
+        self.window = window
+        # Taille d'affichage des frames (palier de la zone d'image, voir Application.display_size)
+        self.max_size = DISPLAY_MAX_SIZE
         self.frames = []
+        # Les frames ont été créées ici (et pas reprises du cache) : les rendre à la réserve à l'arrêt
+        self.owns_frames = False
         self.durations = []
         self.current_frame = 0
         self.animation_id = None
         self.is_playing = False
+        # Lecture en flux : source du GIF, flux en cours et clé du cache mémoire
+        self.source = None
+        self.stream = None
+        self.stream_size = self.max_size
+        self.cache_key = None
+        self.rolling = False
+        # Mémoire occupée par les frames converties depuis le début du flux
+        self.frame_bytes = 0
+        # Lecture cadencée : échéance (horloge monotone) de la prochaine frame, pause si invisible
+        self.deadline = None
+        self.paused = False
+        self.dropped_frames = 0
+
+        # Reprendre la lecture quand le label ou la fenêtre réapparaît
+        self.label.bind("<Map>", self._on_map, add="+")
+        self.parent.bind("<Map>", self._on_map, add="+")
+
+    def stream_gif(self, source, cache_key=None):
+        """Lit un GIF (chemin ou octets) en flux : rien n'est décodé d'avance."""
+        self.stop()
+        self.source = source
+        self.cache_key = cache_key
+        self.owns_frames = True
+        self.stream_size = self.max_size
+        self.stream = GifFrameStream(source, self.stream_size, self.window)
+        return True
 
-    def load_gif(self, source):
-        try:
-            # Nettoyer l'état précédent
-            self.stop()
-            
-            # Ouvrir le GIF
-            if isinstance(source, str):
-                gif = Image.open(source)
-            else:
-                source.seek(0)
-                gif = Image.open(source)
-
-            if gif.format != 'GIF':
-                self.label.config(text="Le fichier n'est pas un GIF")
-                return False
-
-            # Redimensionner si nécessaire en conservant les proportions
-            max_size = (400, 400)
-            original_width, original_height = gif.size
-            ratio = min(max_size[0] / original_width, max_size[1] / original_height)
-            new_width = int(original_width * ratio)
-            new_height = int(original_height * ratio)
-
-            # Lire toutes les frames
-            self.frames = []
-            self.durations = []
-            
-            while True:
-                frame = gif.copy()
-                # Redimensionner la frame en conservant les proportions
-                frame = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                self.frames.append(ImageTk.PhotoImage(frame))
-                self.durations.append(gif.info.get('duration', 100))
-                gif.seek(gif.tell() + 1)
-        except EOFError:
-            pass
-        except Exception as e:
-            print(f"DEBUG: Erreur lors du chargement du GIF: {e}")
-            self.label.config(text=f"Erreur GIF: {e}")
-            return False
-
+    def use_photos(self, photos, durations):
+        """Reprend des frames déjà converties en PhotoImage (par exemple depuis le cache mémoire)."""
+        self.stop()
+        self.frames = list(photos)
+        self.durations = list(durations)
+        return bool(self.frames)
+
+    def _cache_frames(self, cache_key):
+        if cache_key is not None and self.photo_cache is not None:
+            self.photo_cache.put(
+                cache_key,
+                (tuple(self.frames), tuple(self.durations)),
+                photo_nbytes(*self.frames)
+            )
+            # Les frames appartiennent désormais au cache
+            self.owns_frames = False
+
+    def _new_photo(self, frame):
+        if self.photo_pool is not None:
+            return self.photo_pool.acquire(frame)
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(frame)
+
+    def _release(self, photos):
+        if self.owns_frames and self.photo_pool is not None:
+            self.photo_pool.release(*photos)
+
+    def _pump(self):
+        """Convertit en PhotoImage les frames décodées, jusqu'à 'window' frames d'avance."""
+        while self.stream is not None and len(self.frames) - self.current_frame < self.window:
+            item = self.stream.poll()
+            if item is None:
+                return
+            if item is END_OF_STREAM:
+                self._on_stream_end()
+                return
+            frame, duration = item
+            photo = self._new_photo(frame)
+            self.frames.append(photo)
+            self.durations.append(duration)
+            self.frame_bytes += photo_nbytes(photo)
+            # Animation trop lourde pour être gardée en entier : passer en lecture glissante
+            if not self.rolling and self.frame_bytes > GIF_MAX_KEPT_MB * 1024 * 1024:
+                self.rolling = True
+
+    def _on_stream_end(self):
+        self.stream.close()
+        self.stream = None
         if not self.frames:
             self.label.config(text="Aucune frame trouvée dans le GIF")
-            return False
-
-        return True
+            self.is_playing = False
+            return
+        if self.rolling:
+            # Décoder à nouveau pour la boucle suivante
+            self.stream = GifFrameStream(self.source, self.stream_size, self.window)
+        else:
+            # Toutes les frames sont prêtes : boucler sans décoder et garder en cache
+            self._cache_frames(self.cache_key)
 
     def play(self):
-        if not self.frames:
+        if not self.frames and self.stream is None:
             return
-        
+
         self.is_playing = True
+        self.paused = False
+        self.deadline = None
         self._show_next_frame()
 
     def stop(self):
         self.is_playing = False
+        self.paused = False
+        self.deadline = None
         if self.animation_id:
             try:
                 self.parent.after_cancel(self.animation_id)
             except:
                 pass
             self.animation_id = None
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        self.source = None
+        self.cache_key = None
+        self.rolling = False
+        self.frame_bytes = 0
+        self.label.config(image="", text="")
+        self.label.image = None
+        self._release(self.frames)
+        self.owns_frames = False
         self.frames = []
         self.durations = []
         self.current_frame = 0
-        self.label.config(image="", text="")
-        self.label.image = None
+
+    def _is_visible(self):
+        """Le label est-il visible (affiché et fenêtre non réduite) ?"""
+        try:
+            return self.label.winfo_viewable() and self.parent.state() != "iconic"
+        except tk.TclError:
+            return False
+
+    def _on_map(self, event=None):
+        """Reprend la lecture mise en pause quand le label redevient visible."""
+        if self.is_playing and self.paused and self._is_visible():
+            self.paused = False
+            self.deadline = None
+            self._show_next_frame()
+
+    def _next_ready(self):
+        """Index de la frame suivant la frame courante si elle est prête, sinon None."""
+        if self.current_frame + 1 < len(self.frames):
+            return self.current_frame + 1
+        # Toutes les frames sont prêtes : la suivante de la dernière est la première
+        if self.stream is None and len(self.frames) > 1:
+            return 0
+        return None
 
     def _show_next_frame(self):
-        if not self.is_playing or not self.frames:
+        self.animation_id = None
+        if not self.is_playing:
             return
 
         try:
-            self.label.config(image=self.frames[self.current_frame])
-            self.label.image = self.frames[self.current_frame]
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            delay = self.durations[self.current_frame]
+            # Fenêtre réduite ou label masqué : pause, reprise par <Map> (voir _on_map)
+            if not self._is_visible():
+                self.paused = True
+                return
+
+            self._pump()
+            now = time.monotonic()
+            if self.current_frame >= len(self.frames):
+                if self.stream is not None:
+                    # Frame suivante pas encore décodée : réessayer bientôt, l'horloge repart à l'affichage
+                    self.deadline = None
+                    self.animation_id = self.parent.after(GIF_UNDERRUN_DELAY, self._show_next_frame)
+                    return
+                if not self.frames:
+                    return
+                self.current_frame = 0
+
+            # Échéance de la frame courante ; trop de retard (Tk bloqué) : repartir de maintenant
+            if self.deadline is None or now - self.deadline > GIF_MAX_LAG:
+                self.deadline = now
+
+            # En retard : sauter les frames dont le temps d'affichage est déjà écoulé
+            while now >= self.deadline + self.durations[self.current_frame] / 1000:
+                next_frame = self._next_ready()
+                if next_frame is None:
+                    break
+                self.deadline += self.durations[self.current_frame] / 1000
+                self.current_frame = next_frame
+                self.dropped_frames += 1
+
+            photo = self.frames[self.current_frame]
+            self.label.config(image=photo)
+            self.label.image = photo
+            self.deadline += self.durations[self.current_frame] / 1000
+            self.current_frame += 1
+
+            # Lecture glissante : libérer les frames déjà jouées
+            if self.rolling and self.current_frame > 1:
+                self._release(self.frames[:self.current_frame - 1])
+                del self.frames[:self.current_frame - 1]
+                del self.durations[:self.current_frame - 1]
+                self.current_frame = 1
+
+            delay = max(0, round((self.deadline - time.monotonic()) * 1000))
             self.animation_id = self.parent.after(delay, self._show_next_frame)
         except Exception as e:
             print(f"DEBUG: Erreur lors de l'animation: {e}")
@@ -140,6 +314,7 @@ class GifAnimator:
 class Application(tk.Tk):
     def __init__(self):
         super().__init__()
+        startup_phase("fenêtre Tk")
 
         # Main window configuration
         self.title("AnatoLexic - Apprentissage de l'anatomie humaine")
@@ -177,60 +352,165 @@ class Application(tk.Tk):
 
         self.configure(bg=self.bg_color_main)
 
-        # Load icons / images
+        # Icônes et image de fond : chargées après le premier affichage (voir _load_assets)
         self.background = None
-        try:
-            background_image = Image.open(resource_path(os.path.join("assets", "anatomy_background.png")))
-            self.background = ImageTk.PhotoImage(background_image)
-        except Exception as e:
-            print(f"Erreur lors du chargement de l'image de fond: {e}")
-            pass
-
-        # Utility method to load icons
-        def _load_image(path):
-            """Charge une image avec gestion des erreurs"""
-            try:
-                # Vérifier si l'application est en mode développement ou compilée
-                if getattr(sys, 'frozen', False):
-                    # Si l'application est compilée
-                    base_path = sys._MEIPASS
-                else:
-                    # Si l'application est en mode développement
-                    base_path = os.path.dirname(os.path.abspath(__file__))
-                
-                full_path = os.path.join(base_path, path)
-                print(f"Tentative de chargement de l'image : {full_path}")
-                if os.path.exists(full_path):
-                    # Charger l'image PIL
-                    pil_image = Image.open(full_path)
-                    # Convertir en PhotoImage pour Tkinter
-                    return ImageTk.PhotoImage(pil_image)
-                else:
-                    print(f"Image non trouvée: {full_path}")
-                    return None
-            except Exception as e:
-                print(f"Erreur lors du chargement de l'image {path}: {e}")
-                return None
-
-        self.icon_type = _load_image(os.path.join(ICON_PATH, "finger_icon.png"))
-        self.icon_show = _load_image(os.path.join(ICON_PATH, "text_icon.png"))
-        self.icon_definition = _load_image(os.path.join(ICON_PATH, "book_search_icon.png"))
-        self.icon_change = _load_image(os.path.join(ICON_PATH, "refresh_icon.png"))
-        self.icon_wikipedia = _load_image(os.path.join(ICON_PATH, "wikipedia_icon.png"))
-        self.icon_youtube = _load_image(os.path.join(ICON_PATH, "youtube_icon.png"))
-        self.icon_hint = _load_image(os.path.join(ICON_PATH, "lightbulb_icon.png"))
-        self.icon_message = _load_image(os.path.join(ICON_PATH, "message_icon.png"))
+        self.icon_type = None
+        self.icon_show = None
+        self.icon_definition = None
+        self.icon_change = None
+        self.icon_wikipedia = None
+        self.icon_youtube = None
+        self.icon_hint = None
+        self.icon_message = None
 
         self.wikipedia_photo = None
 
         # Créer l'animateur GIF
         self.gif_animator = None
 
+        # Mot affiché et mot suivant, préparés à l'avance (voir utils.word_staging)
+        self.word_entry = None
+        self.next_word = None
+
         # Ajout du contrôle pour le chargement automatique des images
         self.auto_load_images = True
 
+        # Cache disque des images, partagé avec utils.wikipedia_utils
+        try:
+            set_image_cache(DiskImageCache(
+                user_data_path("image_cache"),
+                max_bytes=IMAGE_CACHE_MAX_MB * 1024 * 1024,
+                negative_ttl=IMAGE_NEGATIVE_TTL_DAYS * 24 * 3600
+            ))
+        except OSError as e:
+            print(f"Erreur lors de l'ouverture du cache d'images: {e}")
+
+        # Pack d'images hors ligne (s'il est livré) : seul l'en-tête est lu ici
+        get_image_pack()
+
+        # Images déjà décodées (et frames de GIF), pour réafficher un mot instantanément
+        self.photo_cache = MemoryImageCache(IMAGE_MEMORY_CACHE_MB)
+        # PhotoImage réutilisées d'un mot à l'autre (remplies sur place)
+        self.photo_pool = PhotoPool(PHOTO_POOL_SIZE)
+        # Palier de taille des images, d'après la taille réelle de la zone d'image
+        self.display_size = DISPLAY_MAX_SIZE
+        self.resize_job = None
+
+        # Worker chargé des recherches d'images hors du thread Tk
+        self.image_worker = ImageFetchWorker(self)
+        self.image_job = None
+        # Incrémentée à chaque changement de mot : les résultats d'une autre génération sont ignorés
+        self.image_generation = 0
+
+        # Préchargement des images des autres mots du sous-thème
+        self.prefetcher = SubthemePrefetcher(
+            self,
+            lambda term, cancel_token=None: self.load_wikipedia_image(
+                term, cancel_token=cancel_token, max_size=self.display_size
+            ),
+            self._on_image_prefetched,
+            concurrency=PREFETCH_CONCURRENCY,
+            depth=PREFETCH_DEPTH,
+            # Une seule requête pour les titres exacts ; les autres termes gardent la recherche individuelle
+            resolve_func=lambda terms: resolve_image_urls(
+                [t for t in terms if t not in get_image_cache() and not self._in_image_pack(t)],
+                search_missing=False,
+                max_size=self.display_size
+            )
+        )
+
+        startup_phase("caches et workers")
+
         # Create UI components
         self.create_widgets()
+        startup_phase("interface")
+
+        # Échap annule le chargement d'image en cours
+        self.bind("<Escape>", lambda event: self.cancel_wikipedia_image())
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Les ressources non indispensables attendent que la fenêtre soit réellement dessinée :
+        # after_idle seul peut passer avant que le gestionnaire de fenêtres l'ait affichée
+        self.main_frame.bind("<Expose>", self._on_first_expose)
+
+    def _on_first_expose(self, event):
+        # Une seule fois : les Expose suivants (fenêtre découverte, redimensionnée...) ne rechargent rien
+        self.main_frame.unbind("<Expose>")
+        # Les widgets se redessinent à l'inactivité qui suit l'Expose
+        self.after_idle(self._after_first_paint)
+
+    def _after_first_paint(self):
+        # Terminer les dessins en attente (widgets enfants compris) avant de charger les icônes
+        self.update_idletasks()
+        startup_phase("premier affichage")
+        self._load_assets()
+        startup_phase("icônes et fond")
+        startup_report()
+
+    def _load_icon(self, full_path):
+        """Charge une image (PhotoImage) ; None si le fichier est absent ou illisible."""
+        # Fichier absent : inutile de charger PIL
+        if not os.path.exists(full_path):
+            print(f"Image non trouvée: {full_path}")
+            return None
+
+        from PIL import Image, ImageTk
+
+        try:
+            with Image.open(full_path) as pil_image:
+                return ImageTk.PhotoImage(pil_image)
+        except Exception as e:
+            print(f"Erreur lors du chargement de l'image {full_path}: {e}")
+        return None
+
+    def _load_assets(self):
+        """Charge l'image de fond et les icônes des boutons, puis les ajoute à l'interface."""
+        # Vérifier si l'application est en mode développement ou compilée
+        base_path = sys._MEIPASS if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
+
+        # Atlas construit par build_icon_atlas.py : une seule lecture pour toutes les icônes
+        atlas = load_icon_atlas(os.path.join(base_path, ICON_PATH, ICON_ATLAS_FILE), master=self)
+
+        def icon(name):
+            sliced = atlas.get(os.path.splitext(name)[0])
+            if sliced is not None:
+                return sliced
+            return self._load_icon(os.path.join(base_path, ICON_PATH, name))
+
+        self.background = self._load_icon(resource_path(os.path.join("assets", "anatomy_background.png")))
+        self.icon_type = icon("finger_icon.png")
+        self.icon_show = icon("text_icon.png")
+        self.icon_definition = icon("book_search_icon.png")
+        self.icon_change = icon("refresh_icon.png")
+        self.icon_wikipedia = icon("wikipedia_icon.png")
+        self.icon_youtube = icon("youtube_icon.png")
+        self.icon_hint = icon("lightbulb_icon.png")
+        self.icon_message = icon("message_icon.png")
+        self.main_frame.apply_icons()
+
+    def _in_image_pack(self, term):
+        pack = get_image_pack()
+        return pack is not None and term in pack
+
+    def on_close(self):
+        """Ferme la fenêtre sans attendre les téléchargements en cours."""
+        self.prefetcher.shutdown()
+        self._discard_next_word()
+        self.image_worker.shutdown()
+        shutdown_frame_pool()
+        close_session()
+        # Statistiques seulement si des images ont été cherchées (sans charger la chaîne pour rien)
+        providers = sys.modules.get("utils.image_providers")
+        if providers is not None:
+            debug_log("Statistiques des fournisseurs d'images :\n" + providers.get_image_pipeline().stats_report())
+        try:
+            get_image_cache().flush()
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde du cache d'images: {e}")
+        pack = get_image_pack()
+        if pack is not None:
+            pack.close()
+        self.destroy()
 
     def create_widgets(self):
         """
@@ -261,7 +541,10 @@ class Application(tk.Tk):
         self.main_frame = main_frame
 
         # Créer l'animateur GIF après la création du main_frame
-        self.gif_animator = GifAnimator(self, self.main_frame.wikipedia_label)
+        self.gif_animator = GifAnimator(self, self.main_frame.wikipedia_label, self.photo_cache, self.photo_pool)
+
+        # Taille des images adaptée à la zone d'image (recalculée après un redimensionnement)
+        self.main_frame.wikipedia_frame.bind("<Configure>", self._on_image_area_configure)
 
         # ----- (3) Advanced Frame (row=2) -----
         advanced_frame = AdvancedFrame(
@@ -335,6 +618,7 @@ class Application(tk.Tk):
             words_in_subtheme = words[theme][subtheme]
             if not words_in_subtheme:
                 debug_log("No words in this subtheme.")
+                self._discard_next_word()
                 self.current_word = None
                 self.current_definition = None
                 self.main_frame.word_label.config(
@@ -343,39 +627,53 @@ class Application(tk.Tk):
                 )
                 return
 
-            # Si le nouveau mot est le même que l'ancien, en choisir un autre
-            new_word, new_definition = random.choice(words_in_subtheme)
-            while new_word == self.current_word and len(words_in_subtheme) > 1:
-                new_word, new_definition = random.choice(words_in_subtheme)
+            # Mot préparé pendant l'affichage du précédent : simple échange
+            key = (theme, subtheme, self.flashcard_mode)
+            staged = self.next_word
+            self.next_word = None
+            if staged is None or staged.key != key or staged.word == self.current_word:
+                if staged is not None:
+                    staged.discard(self.photo_pool)
+                # Si le nouveau mot est le même que l'ancien, en choisir un autre
+                new_word, new_definition = pick_word(words_in_subtheme, exclude=(self.current_word,))
+                staged = StagedWord(key, new_word, new_definition,
+                                    display_letters(new_word, self.flashcard_mode))
+            else:
+                debug_log(f"Mot préparé utilisé : {staged.word}")
+            if self.word_entry is not None:
+                self.word_entry.discard(self.photo_pool)
+            self.word_entry = staged
 
-            self.current_word = new_word
-            self.current_definition = new_definition
+            self.current_word = staged.word
+            self.current_definition = staged.definition
             self.letter_index = 0
-            self.main_frame.response_label.config(text="")
-            self.displayed_list = []
-
+            self.image_generation += 1
+
+            # Précharger les images du sous-thème (sans effet si déjà en cours)
+            if self.auto_load_images:
+                self.prefetcher.start(
+                    (theme, subtheme),
+                    [w for w, _ in words_in_subtheme if self._photo_cache_key(w) not in self.photo_cache],
+                    first=staged.word
+                )
+            self.displayed_list = list(staged.letters)
+            self.main_frame.word_label.config(
+                text=" ".join(self.displayed_list),
+                font=("Arial", 48, "bold")
+            )
             if not self.flashcard_mode:
                 debug_log(f"[Normal Mode] Selected word: {self.current_word}")
-                shuffled_word = shuffle_preserving_punctuation(self.current_word)
-                self.displayed_list = list(shuffled_word)
-                self.main_frame.word_label.config(
-                    text=" ".join(self.displayed_list),
-                    font=("Arial", 48, "bold")
-                )
+                self.main_frame.response_label.config(text="")
             else:
                 debug_log(f"[Flashcard Mode] Selected word: {self.current_word}")
-                for c in self.current_word:
-                    if c == " ":
-                        self.displayed_list.append(" ")
-                    else:
-                        self.displayed_list.append("_")
-                self.main_frame.word_label.config(
-                    text=" ".join(self.displayed_list),
-                    font=("Arial", 48, "bold")
-                )
                 self.main_frame.response_label.config(text=self.current_definition)
+
+            # Préparer le mot suivant une fois l'affichage terminé
+            self.after_idle(self._stage_next_word, self.image_generation, key, words_in_subtheme)
         else:
             debug_log("No theme/subtheme selected.")
+            self.prefetcher.cancel()
+            self._discard_next_word()
             self.current_word = None
             self.current_definition = None
             self.displayed_list = []
@@ -384,6 +682,90 @@ class Application(tk.Tk):
                 font=("Arial", 48, "bold")
             )
 
+    def _stage_next_word(self, generation, key, entries):
+        """
+        Prépare le mot suivant pendant que le mot courant est affiché : tirage,
+        lettres mélangées ou masquées, et image chargée en arrière-plan.
+        """
+        # Le mot a encore changé depuis : un autre tirage a été programmé
+        if generation != self.image_generation:
+            return
+        self._discard_next_word()
+        word, definition = pick_word(entries, exclude=(self.current_word,))
+        self.next_word = StagedWord(key, word, definition, display_letters(word, self.flashcard_mode))
+        debug_log(f"Mot suivant préparé : {word}")
+        if self.auto_load_images:
+            self._load_staged_image(self.next_word)
+
+    def _discard_next_word(self):
+        if self.next_word is not None:
+            self.next_word.discard(self.photo_pool)
+            self.next_word = None
+
+    def _load_staged_image(self, staged):
+        """Prépare l'image d'un mot préparé : PhotoImage remplie depuis le cache mémoire, sinon chargement par le worker."""
+        cached = self.photo_cache.get(self._photo_cache_key(staged.word))
+        if cached is not None:
+            # Les frames d'un GIF en cache sont déjà des PhotoImage
+            if not isinstance(cached, tuple):
+                staged.photo = self.photo_pool.acquire(cached)
+            return
+        staged.job = self.image_worker.submit(
+            self.load_wikipedia_image,
+            staged.word,
+            max_size=self.display_size,
+            pass_token=True,
+            callback=lambda result, error: self._on_staged_image_loaded(staged, result, error)
+        )
+
+    def _on_staged_image_loaded(self, staged, result, error):
+        """Reçoit l'image d'un mot préparé (thread Tk)."""
+        job, staged.job = staged.job, None
+        if staged.waiting:
+            # Le mot est déjà affiché et son image demandée : afficher comme un chargement normal
+            staged.waiting = False
+            if staged is self.word_entry and job is self.image_job:
+                self._on_wikipedia_image_loaded(staged.word, self.image_generation, result, error)
+            return
+        if error is not None or not result:
+            return
+        try:
+            image = self._cache_prepared_image(result, staged.word)
+            if image is None:
+                staged.result = result
+            elif result[2] != self.display_size:
+                # Zone d'image redimensionnée pendant le chargement : l'image reste en cache à son palier
+                return
+            elif staged is self.next_word or staged is self.word_entry:
+                staged.photo = self.photo_pool.acquire(image)
+        except Exception as e:
+            print(f"DEBUG: Erreur lors de la préparation de l'image de '{staged.word}': {e}")
+
+    def _show_staged_image(self, word):
+        """
+        Affiche l'image préparée avec le mot courant, ou reprend son chargement
+        encore en cours. Retourne False si rien n'a été préparé pour ce mot.
+        """
+        staged = self.word_entry
+        if staged is None or staged.word != word:
+            return False
+        photo = staged.take_photo()
+        if photo is not None:
+            self._set_wikipedia_photo(photo)
+            return True
+        if staged.result is not None:
+            result, staged.result = staged.result, None
+            return self._display_prepared_image(result, word)
+        if staged.loading:
+            # Reprendre le chargement lancé à l'avance au lieu d'en relancer un
+            label = self.main_frame.wikipedia_label
+            label.config(text="Chargement en cours... (cliquez ou Échap pour annuler)")
+            label.bind("<Button-1>", lambda event: self.cancel_wikipedia_image())
+            staged.waiting = True
+            self.image_job = staged.job
+            return True
+        return False
+
     def change_word(self):
         """Change le mot actuel et réinitialise l'état de l'image."""
         self.reset_wikipedia_label()
@@ -427,15 +809,11 @@ class Application(tk.Tk):
             text=self.current_word,
             font=("Arial", 48, "bold")
         )
-        self.update_idletasks()
         
         # Charger l'image seulement si auto_load_images est activé
+        # (le chargement se fait hors du thread Tk et l'image est souvent déjà préchargée)
         if self.auto_load_images:
-            self.after(1000, self._load_image_after_delay)
-
-    def _load_image_after_delay(self):
-        """Charge l'image Wikipédia après un délai"""
-        self.show_wikipedia_image()
+            self.show_wikipedia_image()
 
     def show_definition(self):
         if not self.check_word_selected():
@@ -561,6 +939,8 @@ class Application(tk.Tk):
     def show_wikipedia(self):
         if not self.check_word_selected():
             return
+        import webbrowser
+
         search_term = self.current_word.replace(" ", "_")
         url_wikipedia = f"https://fr.wikipedia.org/wiki/{search_term}"
         webbrowser.open(url_wikipedia)
@@ -568,12 +948,17 @@ class Application(tk.Tk):
     def open_youtube(self):
         if not self.check_word_selected():
             return
+        import webbrowser
+
         search_term = self.current_word.replace(" ", "+")
         url_youtube = f"https://www.youtube.com/results?search_query={search_term}"
         webbrowser.open(url_youtube)
 
-    def show_wikipedia_image(self):
-        """Affiche une image depuis Wikipedia pour le mot actuel."""
+    def show_wikipedia_image(self, force_refresh=False):
+        """
+        Lance le chargement de l'image Wikipedia du mot actuel en arrière-plan.
+        force_refresh ignore tous les caches et interroge à nouveau Wikipédia.
+        """
         if not self.check_word_selected():
             print("DEBUG: Aucun mot sélectionné")
             return
@@ -582,35 +967,105 @@ class Application(tk.Tk):
         print(f"DEBUG: Tentative d'afficher une image pour: '{word}'")
 
         # Vérifier si c'est le même mot que le dernier chargé
-        if word == self.last_loaded_word:
+        if word == self.last_loaded_word and not force_refresh:
             print("DEBUG: Ce mot a déjà été chargé")
             messagebox.showinfo("Information", "L'image de ce mot est déjà chargée.")
             return
 
+        # Un chargement est déjà en cours pour ce mot
+        if self.image_job is not None and self.image_job.args == (word,) and not force_refresh:
+            print("DEBUG: Chargement déjà en cours pour ce mot")
+            return
+
         # Désactiver le bouton pendant le chargement
         self.permanent_wiki_button.config(state=tk.DISABLED)
         print("DEBUG: Bouton temporairement désactivé")
 
-        # Effacer l'image précédente
+        # Effacer l'image précédente (annule aussi un éventuel chargement en cours)
         self.reset_wikipedia_label()
-        self.main_frame.wikipedia_label.config(text="Chargement en cours...")
-        self.update_idletasks()
+
+        if force_refresh:
+            for tier in DISPLAY_SIZE_TIERS:
+                self.photo_cache.discard(self._photo_cache_key(word, (tier, tier)))
+
+        # Image préparée avec le mot (ou en cours de chargement)
+        if not force_refresh and self._show_staged_image(word):
+            if self.image_job is None:
+                print("DEBUG: Image préparée affichée")
+                self.permanent_wiki_button.config(state=tk.NORMAL)
+                self.last_loaded_word = word
+            return
+
+        # Image déjà décodée récemment : affichage immédiat, sans passer par le worker
+        if self._show_cached_photo(word):
+            print("DEBUG: Image affichée depuis le cache mémoire")
+            self.permanent_wiki_button.config(state=tk.NORMAL)
+            self.last_loaded_word = word
+            return
+
+        label = self.main_frame.wikipedia_label
+        label.config(text="Chargement en cours... (cliquez ou Échap pour annuler)")
+        label.bind("<Button-1>", lambda event: self.cancel_wikipedia_image())
+
+        # Recherche, téléchargement et décodage dans le worker
+        generation = self.image_generation
+        self.image_job = self.image_worker.submit(
+            self.load_wikipedia_image,
+            word,
+            force_refresh=force_refresh,
+            max_size=self.display_size,
+            generation=generation,
+            pass_token=True,
+            callback=lambda result, error: self._on_wikipedia_image_loaded(word, generation, result, error)
+        )
+
+    def refresh_wikipedia_image(self):
+        """Recharge l'image du mot actuel depuis Wikipédia, sans utiliser les caches."""
+        self.show_wikipedia_image(force_refresh=True)
+
+    def cancel_wikipedia_image(self):
+        """Annule le chargement d'image en cours, s'il y en a un."""
+        if self.image_job is None:
+            return
+        print("DEBUG: Chargement de l'image annulé")
+        self.image_job.cancel()
+        self.image_job = None
+        label = self.main_frame.wikipedia_label
+        label.unbind("<Button-1>")
+        label.config(text="Chargement annulé.", image="")
+        self.permanent_wiki_button.config(state=tk.NORMAL)
+
+    def _on_wikipedia_image_loaded(self, word, generation, result, error):
+        """Reçoit le résultat du worker dans le thread Tk et affiche l'image."""
+        # Le mot a changé pendant le chargement : ignorer ce résultat
+        if generation != self.image_generation or word != self.current_word:
+            print(f"DEBUG: Résultat obsolète ignoré pour '{word}'")
+            return
+
+        self.image_job = None
+        self.main_frame.wikipedia_label.unbind("<Button-1>")
+        self.permanent_wiki_button.config(state=tk.NORMAL)
 
         try:
-            # Rechercher l'image sur Wikipedia
-            success = self.load_wikipedia_image(word)
-            
-            if success:
+            if error is not None:
+                raise error
+
+            if result and self._display_prepared_image(result, word):
                 print("DEBUG: Image chargée avec succès")
-                self.permanent_wiki_button.config(state=tk.NORMAL)
                 self.last_loaded_word = word  # Mettre à jour le dernier mot chargé
+            elif not host_available(WIKIPEDIA_API_URL):
+                print("DEBUG: Hors ligne, aucune image locale")
+                self.main_frame.wikipedia_label.config(
+                    text="📡 Hors ligne : aucune image enregistrée pour ce terme.",
+                    image=""
+                )
+                self.last_loaded_word = None
             else:
                 print("DEBUG: Échec du chargement de l'image")
                 self.main_frame.wikipedia_label.config(
                     text="❌ Aucune image disponible pour ce terme.",
                     image=""
                 )
-                self.permanent_wiki_button.config(state=tk.NORMAL)
                 self.last_loaded_word = None  # Réinitialiser le dernier mot chargé en cas d'échec
         except Exception as e:
             print(f"DEBUG: Erreur lors du chargement de l'image: {str(e)}")
@@ -618,211 +1073,213 @@ class Application(tk.Tk):
                 text="❌ Erreur lors du chargement de l'image.",
                 image=""
             )
-            self.permanent_wiki_button.config(state=tk.NORMAL)
             self.last_loaded_word = None  # Réinitialiser le dernier mot chargé en cas d'erreur
 
-    def load_wikipedia_image(self, mot):
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        mot_recherche = mot.replace(" ", "_")
-        api_url = "https://fr.wikipedia.org/w/api.php"
+    def _photo_cache_key(self, word, max_size=None):
+        return (normalize_term(word), max_size or self.display_size)
 
-        print(f"DEBUG: Recherche d'image pour '{mot}' (recherche: '{mot_recherche}')")
-
-        # Première tentative avec le mot exact
-        params = {
-            "action": "query",
-            "format": "json",
-            "prop": "pageimages",
-            "piprop": "original",
-            "titles": mot_recherche,
-            "redirects": 1  # Suivre les redirections
-        }
+    def _show_cached_photo(self, word):
+        """Affiche l'image du mot depuis le cache mémoire. Retourne False si absente."""
+        cached = self.photo_cache.get(self._photo_cache_key(word))
+        if cached is None:
+            return False
+        return self._show_photo(cached)
 
-        try:
-            print("DEBUG: Envoi de la requête à l'API Wikipédia...")
-            r = requests.get(api_url, params=params, headers=headers, timeout=10)
-            r.raise_for_status()
-            data = r.json()
-
-            print("DEBUG: Réponse API reçue")
-            pages = data.get("query", {}).get("pages", {})
-
-            # Si aucune page n'est trouvée, essayer une recherche plus large
-            if not pages or "-1" in pages:
-                print("DEBUG: Aucune page trouvée, tentative de recherche alternative...")
-                # Deuxième tentative avec une recherche plus large
-                params = {
-                    "action": "query",
-                    "format": "json",
-                    "list": "search",
-                    "srsearch": mot_recherche,
-                    "srlimit": 1,
-                    "srprop": "snippet"
-                }
-                
-                r = requests.get(api_url, params=params, headers=headers, timeout=10)
-                r.raise_for_status()
-                search_data = r.json()
-                
-                search_results = search_data.get("query", {}).get("search", [])
-                if search_results:
-                    # Utiliser le premier résultat de recherche
-                    page_title = search_results[0]["title"]
-                    print(f"DEBUG: Page trouvée via recherche : {page_title}")
-                    
-                    # Récupérer l'image pour cette page
-                    params = {
-                        "action": "query",
-                        "format": "json",
-                        "prop": "pageimages",
-                        "piprop": "original",
-                        "titles": page_title,
-                        "redirects": 1
-                    }
-                    
-                    r = requests.get(api_url, params=params, headers=headers, timeout=10)
-                    r.raise_for_status()
-                    data = r.json()
-                    pages = data.get("query", {}).get("pages", {})
-
-            if not pages or "-1" in pages:
-                print("DEBUG: Aucune page trouvée après recherche alternative")
-                return False
-
-            print(f"DEBUG: Nombre de pages trouvées : {len(pages)}")
-
-            for page_id, page_info in pages.items():
-                print(f"DEBUG: Examen de la page {page_id}")
-                print(f"DEBUG: Informations de la page : {page_info}")
-                
-                if "original" in page_info:
-                    img_url = page_info["original"]["source"]
-                    print(f"DEBUG: URL de l'image trouvée : {img_url}")
-
-                    try:
-                        print("DEBUG: Téléchargement de l'image...")
-                        response = requests.get(img_url, headers=headers, timeout=10)
-                        response.raise_for_status()
-                        
-                        print("DEBUG: Conversion des données en image...")
-                        image_data = io.BytesIO(response.content)
-                        image = Image.open(image_data)
-                        
-                        # Vérifier si c'est un GIF
-                        if image.format == 'GIF' and getattr(image, 'is_animated', False):
-                            print("DEBUG: Image GIF animée détectée")
-                            # Utiliser la fonction _load_gif_animation pour les GIFs
-                            self._load_gif_animation(image_data, self.main_frame.wikipedia_label)
-                            return True
-                        else:
-                            print("DEBUG: Image statique détectée")
-                            try:
-                                # Redimensionner l'image si elle est trop grande
-                                max_size = (400, 400)
-                                if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
-                                    image.thumbnail(max_size, Image.Resampling.LANCZOS)
-                                
-                                # Convertir en PhotoImage pour Tkinter
-                                photo = ImageTk.PhotoImage(image)
-                                
-                                # Nettoyer l'ancienne image si elle existe
-                                if hasattr(self.main_frame.wikipedia_label, 'image'):
-                                    del self.main_frame.wikipedia_label.image
-                                
-                                # Garder une référence à la nouvelle image
-                                self.main_frame.wikipedia_label.image = photo
-                                
-                                # Afficher l'image
-                                self.main_frame.wikipedia_label.config(image=photo)
-                                return True
-                                
-                            except Exception as e:
-                                print(f"DEBUG: Erreur lors du traitement de l'image statique : {e}")
-                                return False
-
-                    except requests.exceptions.RequestException as e:
-                        print(f"DEBUG: Erreur lors du téléchargement de l'image : {e}")
-                        return False
-                    except Exception as e:
-                        print(f"DEBUG: Erreur lors du traitement de l'image : {e}")
-                        return False
-
-            print("DEBUG: Aucune image trouvée dans les pages")
+    def _show_photo(self, cached):
+        """Affiche une image PIL décodée, ou anime un tuple (frames, durées) de GIF."""
+        if isinstance(cached, tuple):
+            frames, durations = cached
+            if self.gif_animator.use_photos(frames, durations):
+                self.gif_animator.play()
+                return True
             return False
 
-        except requests.exceptions.RequestException as e:
-            print(f"DEBUG: Erreur lors de la requête API : {e}")
+        # PhotoImage réutilisée, remplie avec les pixels de l'image
+        self._set_wikipedia_photo(self.photo_pool.acquire(cached))
+        return True
+
+    def _display_prepared_image(self, result, word):
+        """Crée les PhotoImage à partir d'une image déjà décodée (thread Tk uniquement)."""
+        if result[0] == "gif":
+            # Décodage au fil de la lecture, au palier actuel ; l'animateur met les frames en cache s'il les garde toutes
+            _, data, _ = result
+            self.gif_animator.stream_gif(data, self._photo_cache_key(word))
+            self.gif_animator.play()
+            return True
+
+        image = self._cache_prepared_image(result, word)
+        if image is None:
             return False
+        return self._show_photo(image)
+
+    def _cache_prepared_image(self, result, word):
+        """
+        Met en cache mémoire une image statique décodée par le worker et la retourne ;
+        la PhotoImage n'est remplie qu'à l'affichage (voir PhotoPool).
+        Les GIF ne sont pas convertis d'avance (voir GifAnimator.stream_gif) : retourne None.
+        """
+        if result[0] == "gif":
+            return None
+
+        _, image, max_size = result
+        self.photo_cache.put(self._photo_cache_key(word, max_size), image, image_nbytes(image))
+        return image
+
+    def _on_image_prefetched(self, word, result, error):
+        """Reçoit une image préchargée : elle sera affichée sans attente le moment venu."""
+        if error is not None or not result:
+            return
+        try:
+            self._cache_prepared_image(result, word)
+            debug_log(f"Image préchargée pour '{word}'")
         except Exception as e:
-            print(f"DEBUG: Erreur inattendue : {e}")
-            return False
+            print(f"DEBUG: Erreur lors du préchargement de '{word}': {e}")
+
+    def _set_wikipedia_photo(self, photo):
+        label = self.main_frame.wikipedia_label
+        previous = self.wikipedia_photo
+
+        # Garder une référence à la nouvelle image
+        self.wikipedia_photo = photo
+        label.image = photo
+
+        # Afficher l'image
+        label.config(image=photo, text="")
+
+        # L'ancienne PhotoImage n'est plus affichée : elle retourne à la réserve
+        if previous is not None and previous is not photo:
+            self.photo_pool.release(previous)
+
+    def load_wikipedia_image(self, mot, force_refresh=False, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        """
+        Recherche et décode l'image de 'mot' via la chaîne de fournisseurs
+        (dossier local, cache disque, Wikipédia, Commons), réduite au palier max_size ;
+        une image en cache plus petite que ce palier est remplacée par une plus grande.
+        Exécutée dans le worker d'images : ne doit jamais toucher aux widgets Tk.
+        Retourne ("static", image, max_size) ou ("gif", octets du GIF, max_size), ou None si aucune image.
+        force_refresh ignore le cache disque, y compris les termes connus comme sans image.
+        Si cancel_token est annulé (mot abandonné), lève ImageRequestCancelled
+        au plus tôt : entre deux requêtes, pendant le téléchargement ou avant le décodage.
+        """
+        from utils.image_providers import get_image_pipeline
+
+        result = get_image_pipeline().fetch(mot, force_refresh=force_refresh, cancel_token=cancel_token,
+                                            max_size=max_size)
+        if result is None:
+            return None
+
+        # Mot abandonné entre-temps : l'image reste en cache mais n'est pas décodée
+        raise_if_cancelled(cancel_token)
 
-    def _load_gif_animation(self, source, label):
-        """Gère l'animation d'un GIF (depuis un fichier local ou un flux BytesIO)."""
         try:
-            # Réinitialiser le label
-            label.config(image="", text="")
-            label.image = None
+            return self._decode_display_bytes(result.data, max_size)
+        except Exception as e:
+            print(f"DEBUG: Erreur lors du traitement de l'image : {e}")
+            if result.provider == "cache" and not force_refresh:
+                print("DEBUG: Entrée de cache illisible, nouveau téléchargement")
+                return self.load_wikipedia_image(mot, force_refresh=True, cancel_token=cancel_token, max_size=max_size)
+            return None
 
-            # Ouvrir et redimensionner le GIF
-            if isinstance(source, str):
-                gif = Image.open(source)
-            else:
-                source.seek(0)
-                gif = Image.open(source)
+    def _decode_display_bytes(self, data, max_size=DISPLAY_MAX_SIZE):
+        """
+        Décode des octets d'image préparés par la chaîne de fournisseurs (worker uniquement).
+        Retourne ("static", image réduite à max_size, max_size) ou ("gif", octets, max_size) :
+        un GIF animé est décodé au fil de la lecture par GifAnimator.
+        """
+        from PIL import Image
+        from utils.image_decode import fit_image, prepare_decode
+
+        image = Image.open(io.BytesIO(data))
+
+        # Vérifier si c'est un GIF
+        if image.format == 'GIF' and getattr(image, 'is_animated', False):
+            print("DEBUG: Image GIF animée détectée")
+            return ("gif", bytes(data), max_size)
+
+        print("DEBUG: Image statique détectée")
+        # Décodage complet (réduit dès le décodage pour un JPEG) avant de quitter le worker
+        prepare_decode(image, max_size)
+        return ("static", fit_image(image, max_size), max_size)
+
+    def _on_image_area_configure(self, event):
+        """Zone d'image redimensionnée : la taille des images est recalculée une fois le redimensionnement terminé."""
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(IMAGE_RESIZE_DEBOUNCE_MS, self._apply_display_size, event.width, event.height)
+
+    def _apply_display_size(self, width, height):
+        """Passe au palier de taille qui tient dans la zone d'image et réaffiche l'image courante."""
+        self.resize_job = None
+        size = display_size_for(width, height)
+        if size == self.display_size:
+            return
+        debug_log(f"Zone d'image de {width}x{height} : images en {size[0]}x{size[1]}")
+        self.display_size = size
+        self.gif_animator.max_size = size
 
-            # Obtenir les dimensions originales
-            width, height = gif.size
-            max_size = (400, 400)  # Revenir à la taille maximale de 400x400
+        # Images préparées à l'ancien palier : elles seront refaites au nouveau
+        for staged in (self.word_entry, self.next_word):
+            if staged is not None:
+                self.photo_pool.release(staged.take_photo())
+        if self.next_word is not None and self.auto_load_images and not self.next_word.loading:
+            self._load_staged_image(self.next_word)
 
-            # Calculer le ratio pour le redimensionnement tout en préservant l'aspect
-            ratio = min(max_size[0]/width, max_size[1]/height)
-            new_width = int(width * ratio)
-            new_height = int(height * ratio)
+        if self.current_word and self.last_loaded_word == self.current_word:
+            self._rerender_wikipedia_image(self.current_word)
 
-            # Redimensionner le GIF
-            resized_frames = []
-            try:
-                while True:
-                    # Copier et redimensionner la frame
-                    frame = gif.copy()
-                    frame = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    resized_frames.append(frame)
-                    gif.seek(gif.tell() + 1)
-            except EOFError:
-                pass
+    def _rerender_wikipedia_image(self, word):
+        """
+        Réaffiche l'image affichée au palier courant, sans l'effacer d'abord :
+        depuis le cache mémoire, sinon décodée à nouveau dans le worker (depuis
+        le cache disque, ou téléchargée plus grande si l'image en cache ne
+        couvre pas ce palier).
+        """
+        # Un chargement est déjà en cours : il aboutira à l'ancien palier
+        if self.image_job is not None:
+            return
 
-            # Créer un nouveau GIF redimensionné
-            output = io.BytesIO()
-            resized_frames[0].save(
-                output,
-                format='GIF',
-                save_all=True,
-                append_images=resized_frames[1:],
-                duration=gif.info.get('duration', 100),
-                loop=0
-            )
-            output.seek(0)
+        cached = self.photo_cache.get(self._photo_cache_key(word))
+        if cached is not None:
+            self.gif_animator.stop()
+            self._show_photo(cached)
+            return
 
-            # Charger le GIF redimensionné
-            if self.gif_animator.load_gif(output):
-                self.gif_animator.play()
+        generation = self.image_generation
+        self.image_job = self.image_worker.submit(
+            self.load_wikipedia_image,
+            word,
+            max_size=self.display_size,
+            generation=generation,
+            pass_token=True,
+            callback=lambda result, error: self._on_image_rerendered(word, generation, result, error)
+        )
 
+    def _on_image_rerendered(self, word, generation, result, error):
+        if generation != self.image_generation or word != self.current_word:
+            return
+        self.image_job = None
+        # En cas d'échec, l'image à l'ancien palier reste affichée
+        if error is not None or not result:
+            return
+        try:
+            self.gif_animator.stop()
+            self._display_prepared_image(result, word)
         except Exception as e:
-            print(f"DEBUG: Erreur lors du chargement du GIF: {e}")
-            label.config(text=f"Erreur lors du chargement du GIF: {e}")
-            return False
+            print(f"DEBUG: Erreur lors du réaffichage de l'image: {e}")
 
     def reset_wikipedia_label(self):
         """Reset complet du label Wikipedia"""
         try:
+            # Abandonner le chargement d'image en cours
+            if self.image_job is not None:
+                self.image_job.cancel()
+                self.image_job = None
+            self.main_frame.wikipedia_label.unbind("<Button-1>")
+
             # Désactiver le bouton
             self.permanent_wiki_button.config(state=tk.DISABLED)
 
-            # Supprimer toutes les références d'image
-            self.wikipedia_photo = None
-            
-            # Arrêter l'animation GIF
+            # Arrêter l'animation GIF (ses frames retournent à la réserve)
             if self.gif_animator:
                 self.gif_animator.stop()
             
@@ -830,55 +1287,17 @@ class Application(tk.Tk):
             label = self.main_frame.wikipedia_label
             label.config(image="", text="")
             label.image = None
+
+            # La PhotoImage n'est plus affichée : la rendre à la réserve, sans gc.collect()
+            self.photo_pool.release(self.wikipedia_photo)
+            self.wikipedia_photo = None
             
             # Réinitialiser le dernier mot chargé
             self.last_loaded_word = None
             
-            # Nettoyer la mémoire
-            import gc
-            gc.collect()
-
-            # Forcer la mise à jour
-            self.update_idletasks()
-            
         except Exception as e:
             print(f"DEBUG: Erreur lors du reset du label: {e}")
 
-    def create_local_image_dict(self):
-        """Crée un dictionnaire d'images locales pour les termes anatomiques courants"""
-        self.local_images = {
-            "humérus": os.path.join("images", "humerus.jpg"),
-            "scapula": os.path.join("images", "scapula.jpg"),
-            "coeur": os.path.join("images", "coeur.jpg"),
-            "poumon": os.path.join("images", "poumon.jpg"),
-            # etc.
-        }
-
-    def show_local_image(self):
-        """Affiche une image locale si disponible"""
-        if not self.current_word:
-            return False
-
-        word_lower = self.current_word.lower()
-
-        # Vérifier si nous avons un dictionnaire d'images locales
-        if hasattr(self, 'local_images') and word_lower in self.local_images:
-            img_path = resource_path(self.local_images[word_lower])
-            if os.path.exists(img_path):
-                try:
-                    img = Image.open(img_path)
-                    img.thumbnail((400, 400), Image.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    self.wikipedia_photo = photo
-                    self.main_frame.wikipedia_label.config(image=photo, text="")
-                    self.main_frame.wikipedia_label.image = photo
-                    self.permanent_wiki_button.config(state=tk.NORMAL)
-                    return True
-                except Exception as e:
-                    print(f"Erreur avec l'image locale: {e}")
-
-        return False
-
     # -------------- Score / Stats / TTS / About --------------
 
     def update_score(self):
@@ -954,6 +1373,11 @@ class Application(tk.Tk):
     def toggle_auto_images(self):
         """Bascule le chargement automatique des images."""
         self.auto_load_images = not self.auto_load_images
+        if not self.auto_load_images:
+            self.prefetcher.cancel()
+            # Le mot suivant reste préparé, sans son image
+            if self.next_word is not None:
+                self.next_word.discard(self.photo_pool)
         self.bottom_frame.auto_images_button.config(
             text="Auto Images: ON" if self.auto_load_images else "Auto Images: OFF",
             bg=self.bg_color_frame if self.auto_load_images else self.bg_color_buttons
@@ -0,0 +1,100 @@
+"""
+Mesure la latence d'un changement de mot (update_word) dans l'application.
+
+Usage :
+    python bench_word_switch.py [--switches 200] [--images N] [--repeat 5]
+
+--images N met N images factices dans le cache mémoire, comme après une
+longue session, pour montrer le coût de gc.collect() qui croît avec le
+nombre d'objets vivants. --repeat N enchaîne N séries de --switches
+changements et donne la médiane de chaque série, pour juger du bruit de
+mesure. Nécessite un affichage (Tk).
+
+Pour les chiffres « avant » (gc.collect() et update_idletasks() à chaque
+changement, PhotoImage recréées), lancer ce même script depuis une copie du
+dépôt au commit qui précède la réserve de PhotoImage (utils/photo_pool.py),
+6dffc00 :
+
+    git worktree add ../anatolexic-avant 6dffc00
+    cp bench_word_switch.py ../anatolexic-avant/
+    python ../anatolexic-avant/bench_word_switch.py --images 500
+
+Le script n'utilise que ce qui existe des deux côtés (update_word, le cache
+mémoire et le choix du thème) : c'est l'application de chaque arbre qui est
+mesurée, pas une imitation de l'ancien comportement. La dernière ligne
+affichée (commit, images en cache, moyenne, médiane, p95) se colle telle
+quelle dans un tableau Markdown, une ligne par arbre mesuré.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import time
+
+from PIL import Image
+
+import app as app_module
+from app import Application
+from words import words
+
+
+def fill_photo_cache(app, count):
+    """Met 'count' images factices dans le cache mémoire de l'application."""
+    for i in range(count):
+        image = Image.new("RGB", (400, 300), (i % 256, 0, 0))
+        app.photo_cache.put(("bench", i), image, image.size[0] * image.size[1] * 4)
+
+
+def tree_commit():
+    """Commit de l'arbre mesuré (celui d'app.py), ou '?' hors d'un dépôt git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(app_module.__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "?"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure la latence des changements de mot d'AnatoLexic.")
+    parser.add_argument("--switches", type=int, default=200, help="nombre de changements de mot")
+    parser.add_argument("--images", type=int, default=0, help="images factices à mettre en cache")
+    parser.add_argument("--repeat", type=int, default=1, help="nombre de séries de mesures")
+    args = parser.parse_args()
+
+    app = Application()
+    app.withdraw()
+    if app.auto_load_images:
+        app.toggle_auto_images()
+    fill_photo_cache(app, args.images)
+
+    theme = next(iter(words))
+    app.theme_var.set(theme)
+    app.subtheme_var.set(next(iter(words[theme])))
+
+    timings = []
+    for series in range(args.repeat):
+        series_timings = []
+        for _ in range(args.switches):
+            start = time.perf_counter()
+            app.update_word()
+            series_timings.append((time.perf_counter() - start) * 1000)
+            # Laisser Tk traiter ses événements entre deux changements, hors mesure
+            app.update()
+        if args.repeat > 1:
+            print(f"série {series + 1} : médiane {statistics.median(series_timings):.2f} ms")
+        timings.extend(series_timings)
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    mean = statistics.mean(timings)
+    median = statistics.median(timings)
+    print(f"{app_module.__file__} : {args.repeat} x {args.switches} changements, {args.images} images en cache")
+    print(f"moyenne {mean:.2f} ms, médiane {median:.2f} ms, p95 {p95:.2f} ms, max {timings[-1]:.2f} ms")
+    print(f"| {tree_commit()} | {args.images} | {mean:.2f} | {median:.2f} | {p95:.2f} |")
+    app.on_close()
+
+
+if __name__ == "__main__":
+    main()
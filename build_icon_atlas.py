@@ -0,0 +1,42 @@
+"""
+Construit l'atlas des icônes de l'interface (utils.icon_atlas) à partir des PNG du dossier assets.
+
+Usage :
+    python build_icon_atlas.py [--assets assets] [--output assets/icons_atlas.png] [--size 64]
+
+Les icônes sont réduites à --size pixels et assemblées dans une seule image,
+avec le manifeste (position de chaque icône) dans un bloc texte du PNG :
+l'application les charge en une seule lecture. L'atlas est versionné avec
+les icônes : le reconstruire (et le commiter) après avoir ajouté ou modifié
+une icône. Sans atlas, l'application charge les icônes une par une.
+"""
+import argparse
+import os
+
+from utils.icon_atlas import ICON_ATLAS_FILE, ICON_SIZE, build_icon_atlas, write_icon_atlas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construit l'atlas des icônes d'AnatoLexic.")
+    parser.add_argument("--assets", default="assets", help="dossier des icônes")
+    parser.add_argument("--output", default=None, help=f"atlas à écrire (par défaut <assets>/{ICON_ATLAS_FILE})")
+    parser.add_argument("--size", type=int, default=ICON_SIZE, help="côté des icônes dans l'atlas, en pixels")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.assets, ICON_ATLAS_FILE)
+    paths = [
+        os.path.join(args.assets, name)
+        for name in sorted(os.listdir(args.assets))
+        if name.lower().endswith(".png") and name != os.path.basename(output)
+    ]
+    if not paths:
+        parser.error(f"aucune icône PNG dans {args.assets}")
+
+    atlas, manifest = build_icon_atlas(paths, args.size)
+    write_icon_atlas(output, atlas, manifest)
+    print(f"{len(manifest)} icônes écrites dans {output} ({atlas.size[0]}x{atlas.size[1]}, "
+          f"{os.path.getsize(output) / 1024:.1f} Ko)")
+
+
+if __name__ == "__main__":
+    main()
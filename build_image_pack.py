@@ -0,0 +1,127 @@
+"""
+Construit le pack d'images hors ligne (utils.image_pack) pour tous les termes de words.py.
+
+Usage :
+    python build_image_pack.py [--output anatolexic_images.pack] [--workers 4] [--refresh] [--size 400]
+                               [--rate 5] [--burst 5]
+
+Les images sont cherchées par la même chaîne de fournisseurs que l'application
+(dossier local, cache disque, Wikipédia, Commons), pour un affichage à --size
+pixels : elles sont gardées au palier de miniature Wikimedia qui couvre cette
+taille. L'application n'en télécharge de plus grandes que si la zone d'image
+dépasse cette taille. Le pack produit est à placer à côté de l'exécutable.
+
+Comme pour warm_image_cache.py, au plus --rate requêtes HTTP par seconde
+partent vers Wikimédia et une réponse 429 suspend toutes les requêtes pendant
+le délai Retry-After. Les termes dont la recherche a échoué (erreur réseau,
+téléchargement refusé...) sont listés à part des termes réellement sans
+image : relancer le script pour les retenter.
+
+Fermer l'application avant de reconstruire le pack : sous Windows, le pack
+qu'elle garde ouvert ne peut pas être remplacé (le script le signale, et les
+images restent dans le cache disque pour la relance).
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from words import words
+from utils.display_size import DISPLAY_MAX_SIZE, covers
+from utils.image_decode import shrink_image_bytes
+from utils.image_pack import PACK_FILE, write_image_pack, set_image_pack
+from utils.image_providers import get_image_pipeline
+from utils.image_cache import get_image_cache
+from utils.http_client import close_session, set_rate_limiter
+from utils.rate_limit import TokenBucket
+from utils.wikipedia_utils import resolve_image_urls, thumbnail_size_for
+
+
+def all_terms():
+    """Tous les termes de words.py, sans doublons, dans l'ordre du fichier."""
+    terms = []
+    seen = set()
+    for subthemes in words.values():
+        for entries in subthemes.values():
+            for term, _ in entries:
+                if term not in seen:
+                    seen.add(term)
+                    terms.append(term)
+    return terms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construit le pack d'images hors ligne d'AnatoLexic.")
+    parser.add_argument("--output", default=PACK_FILE, help="chemin du pack à écrire")
+    parser.add_argument("--workers", type=int, default=4, help="recherches simultanées")
+    parser.add_argument("--refresh", action="store_true", help="ignorer le cache disque et tout retélécharger")
+    parser.add_argument("--size", type=int, default=DISPLAY_MAX_SIZE[0], help="taille d'affichage visée, en pixels")
+    parser.add_argument("--rate", type=float, default=5, help="requêtes HTTP par seconde")
+    parser.add_argument("--burst", type=float, default=None, help="requêtes accumulables (par défaut : --rate)")
+    args = parser.parse_args()
+
+    max_size = (args.size, args.size)
+    # Taille des images du pack : le palier de miniature téléchargé pour max_size
+    step = thumbnail_size_for(max_size)
+    pack_size = (step, step)
+
+    # Ne pas réutiliser un ancien pack : les images viennent du cache ou du réseau
+    set_image_pack(None)
+    set_rate_limiter(TokenBucket(args.rate, args.burst))
+    pipeline = get_image_pipeline()
+
+    terms = all_terms()
+    print(f"{len(terms)} termes à traiter")
+    start = time.perf_counter()
+
+    # Les titres exacts sont résolus en lot avant les recherches individuelles
+    if not args.refresh:
+        resolve_image_urls([term for term in terms if term not in get_image_cache()], search_missing=False,
+                           max_size=max_size)
+
+    def fetch(term):
+        try:
+            return term, pipeline.fetch(term, force_refresh=args.refresh, max_size=max_size)
+        except Exception as e:
+            print(f"Erreur pour '{term}': {e}")
+            return term, None
+
+    images = []
+    missing = []
+    failed = []
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for term, result in executor.map(fetch, terms):
+            if result is None:
+                # Seul un terme mémorisé comme absent est sans image : sinon une requête a échoué
+                (missing if get_image_cache().is_missing(term) else failed).append(term)
+            elif covers(pack_size, result.max_size):
+                images.append((term, result.data, result.image_format, result.max_size))
+            else:
+                # Image du cache disque téléchargée pour une zone plus grande : inutile dans le pack
+                data, image_format = shrink_image_bytes(result.data, pack_size)
+                images.append((term, data, image_format, pack_size))
+
+    get_image_cache().flush()
+    close_session()
+    try:
+        count = write_image_pack(args.output, images)
+    except PermissionError as e:
+        print(f"Impossible de remplacer {args.output} ({e}) : fermer AnatoLexic, qui garde le pack ouvert, "
+              f"puis relancer le script")
+        raise SystemExit(1)
+
+    size = sum(len(data) for _, data, _, _ in images)
+    print(f"{count} images écrites dans {args.output} ({size / 1024 / 1024:.1f} Mo) "
+          f"en {time.perf_counter() - start:.0f} s")
+    if missing:
+        print(f"{len(missing)} termes sans image :")
+        for term in missing:
+            print(f"  {term}")
+    if failed:
+        print(f"{len(failed)} termes en erreur, absents du pack (relancer pour les retenter) :")
+        for term in failed:
+            print(f"  {term}")
+    print(pipeline.stats_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,20 @@
-import tkinter as tk
+import sys
 import traceback
 import os
+import multiprocessing
+
+# Importé en premier : mesure le démarrage depuis le lancement
+from utils.startup_timing import enable_startup_timing, startup_phase
 
 if __name__ == "__main__":
+    # Nécessaire au pool de processus (frames de GIF) dans l'exécutable PyInstaller
+    multiprocessing.freeze_support()
+    # python main.py --startup-timing : durée de chaque phase du démarrage
+    if "--startup-timing" in sys.argv:
+        enable_startup_timing()
     try:
         from app import Application
+        startup_phase("imports")
         app = Application()
         app.mainloop()
     except Exception as e: 
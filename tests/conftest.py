@@ -0,0 +1,10 @@
+"""
+Configuration de pytest : les tests importent les modules de la racine du
+dépôt (warm_image_cache, utils...), quel que soit le dossier d'où pytest est lancé.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
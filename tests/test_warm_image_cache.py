@@ -0,0 +1,202 @@
+"""
+Tests de warm_image_cache.py contre un serveur HTTP local qui imite les API
+Wikipédia et Commons (pas d'accès à Internet).
+
+    pytest tests
+"""
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image
+
+import warm_image_cache
+from utils import http_client, image_cache, image_decode, image_pack, image_providers, wikipedia_utils
+from utils.http_client import close_session, set_rate_limiter
+from utils.image_cache import DiskImageCache, set_image_cache
+from utils.image_pack import set_image_pack
+from utils.image_providers import (
+    CommonsSearchProvider, ImagePipeline, LocalDirectoryProvider, WikipediaPageImagesProvider, set_image_pipeline,
+)
+from utils.rate_limit import TokenBucket
+
+# Pages du faux Wikipédia qui ont une image
+PAGES_WITH_IMAGE = ("Foie", "Rate", "Pancréas")
+
+# Délai Retry-After de la réponse 429 (en secondes)
+RETRY_AFTER = 1
+
+
+def png_bytes(size=(64, 48)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeWikimedia(BaseHTTPRequestHandler):
+    """Répond aux requêtes pageimages, search et aux téléchargements d'images."""
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        with server.lock:
+            # Seule la première requête pageimages est refusée : c'est elle qui fournit l'image
+            throttle = server.throttle_next and params.get("prop") == "pageimages"
+            if throttle:
+                server.throttle_next = False
+            server.requests.append((time.monotonic(), parts.path, params, throttle))
+
+        if throttle:
+            self.send_response(429)
+            self.send_header("Retry-After", str(RETRY_AFTER))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if parts.path.startswith("/img/"):
+            self._send(server.image, "image/png")
+            return
+
+        pages = {}
+        if params.get("prop") == "pageimages":
+            host = f"http://127.0.0.1:{server.server_address[1]}"
+            for index, title in enumerate(params["titles"].split("|")):
+                if title in PAGES_WITH_IMAGE:
+                    pages[str(index + 1)] = {"title": title, "thumbnail": {"source": f"{host}/img/{index}.png"}}
+            if not pages:
+                pages["-1"] = {}
+        body = {"query": {"pages": pages, "search": []}}
+        self._send(json.dumps(body).encode("utf-8"), "application/json")
+
+    def _send(self, data, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WarmImageCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeWikimedia)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.throttle_next = False
+        self.server.image = png_bytes()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        host = f"http://127.0.0.1:{self.server.server_address[1]}"
+        patches = [
+            mock.patch.dict(os.environ, {"NO_PROXY": "127.0.0.1", "no_proxy": "127.0.0.1"}),
+            mock.patch.object(wikipedia_utils, "WIKIPEDIA_API_URL", f"{host}/wiki/api.php"),
+            mock.patch.object(wikipedia_utils, "COMMONS_API_URL", f"{host}/commons/api.php"),
+            # État partagé des modules, remis tel quel après chaque test (disjoncteurs
+            # par hôte compris : tous les serveurs de test sont sur 127.0.0.1)
+            mock.patch.object(wikipedia_utils, "_resolved_images", {}),
+            mock.patch.object(http_client, "_breakers", {}),
+            mock.patch.object(http_client, "_rate_limiter", None),
+            mock.patch.object(image_cache, "_default_cache", None),
+            mock.patch.object(image_pack, "_default_pack", None),
+            mock.patch.object(image_pack, "_pack_opened", False),
+            mock.patch.object(image_providers, "_default_pipeline", None),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        images_dir = os.path.join(self.directory, "images")
+        os.makedirs(images_dir)
+        with open(os.path.join(images_dir, "rein.png"), "wb") as f:
+            f.write(self.server.image)
+
+        set_image_cache(DiskImageCache(os.path.join(self.directory, "cache")))
+        set_image_pack(None)
+        set_image_pipeline(ImagePipeline([
+            LocalDirectoryProvider(images_dir, aliases={}),
+            WikipediaPageImagesProvider(),
+            CommonsSearchProvider(),
+        ]))
+        set_rate_limiter(TokenBucket(50))
+        self.checkpoint = os.path.join(self.directory, "checkpoint.json")
+
+    def tearDown(self):
+        close_session()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def requested_titles(self):
+        return {params["titles"] for _, _, params, _ in self.server.requests if "titles" in params}
+
+    def test_statuses(self):
+        self.assertEqual(warm_image_cache.warm_term("Foie")["status"], "hit")
+        self.assertEqual(warm_image_cache.warm_term("Estomac")["status"], "miss")
+
+        # Image du dossier images/ : signalée comme locale, sans aucune requête
+        row = warm_image_cache.warm_term("rein")
+        self.assertEqual((row["status"], row["provider"], row["bytes"]), ("local", "local", 0))
+        self.assertNotIn("rein", self.requested_titles())
+
+    def test_unusable_image(self):
+        # PNG trop grand à décoder : mémorisé comme sans image, pas retéléchargé au prochain affichage
+        self.server.image = png_bytes((1200, 900))
+        with mock.patch.object(image_decode, "MAX_DECODE_PIXELS", 500_000):
+            self.assertEqual(warm_image_cache.warm_term("Foie")["status"], "miss")
+            count = len(self.server.requests)
+            self.assertEqual(warm_image_cache.warm_term("Foie")["status"], "miss")
+        self.assertEqual(len(self.server.requests), count)
+
+    def test_retry_after(self):
+        self.server.throttle_next = True
+        row = warm_image_cache.warm_term("Foie")
+        self.assertEqual(row["status"], "hit", row["error"])
+
+        # La requête refusée est retentée après Retry-After, et aucune requête
+        # n'est partie entre-temps (celles déjà envoyées avec elle mises à part)
+        requests = self.server.requests
+        throttled_at, path, params, _ = next(request for request in requests if request[3])
+        retried_at = next(when for when, *request in requests if request == [path, params, False])
+        self.assertGreaterEqual(retried_at - throttled_at, RETRY_AFTER - 0.05)
+        paused = [when for when, *_ in requests if throttled_at + 0.2 < when < throttled_at + RETRY_AFTER - 0.05]
+        self.assertEqual(paused, [])
+
+    def test_checkpoint_resume(self):
+        previous = {
+            "Foie": {"term": "Foie", "status": "hit", "provider": "wikipedia", "bytes": 10,
+                     "latency_ms": 5, "error": ""},
+            "Rate": {"term": "Rate", "status": "error", "provider": "", "bytes": 0,
+                     "latency_ms": 5, "error": "échec réseau ou téléchargement"},
+        }
+        warm_image_cache.save_checkpoint(self.checkpoint, previous)
+
+        done = warm_image_cache.warm_terms(["Foie", "Rate", "Pancréas"], self.checkpoint, workers=2)
+
+        # Le terme déjà traité n'est pas redemandé, celui en erreur est retenté
+        self.assertNotIn("Foie", self.requested_titles())
+        self.assertEqual(done["Foie"], previous["Foie"])
+        self.assertEqual(done["Rate"]["status"], "hit")
+        self.assertEqual(done["Pancréas"]["status"], "hit")
+        self.assertEqual(warm_image_cache.load_checkpoint(self.checkpoint), done)
+
+        # Relancer sans rien à faire : aucune requête
+        count = len(self.server.requests)
+        warm_image_cache.warm_terms(["Foie", "Rate", "Pancréas"], self.checkpoint)
+        self.assertEqual(len(self.server.requests), count)
+
+
+if __name__ == "__main__":
+    unittest.main()
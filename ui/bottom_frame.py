@@ -79,6 +79,16 @@ class BottomFrame(tk.Frame):
         )
         self.show_image_button.pack(side=tk.LEFT, padx=5)
 
+        # Bouton Rafraîchir image (ignore les caches)
+        self.refresh_image_button = tk.Button(
+            buttons_frame,
+            text="Rafraîchir image",
+            font=("Arial", 10, "bold"),
+            bg=self["bg"],
+            command=self.parent.refresh_wikipedia_image
+        )
+        self.refresh_image_button.pack(side=tk.LEFT, padx=5)
+
         # TTS Button (if available)
         if self.tts_available:
             self.tts_button = tk.Button(
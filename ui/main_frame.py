@@ -1,7 +1,5 @@
 import tkinter as tk
-import webbrowser
 from tkinter import messagebox
-from PIL import Image, ImageTk
 
 
 class MainFrame(tk.Frame):
@@ -162,4 +160,18 @@ class MainFrame(tk.Frame):
             bg=self.parent.bg_color_buttons,
             command=self.parent.open_youtube
         )
-        self.youtube_button.grid(row=0, column=6, padx=5, sticky="ew")
\ No newline at end of file
+        self.youtube_button.grid(row=0, column=6, padx=5, sticky="ew")
+
+    def apply_icons(self):
+        """Ajoute aux boutons les icônes, chargées après le premier affichage de la fenêtre."""
+        for button, icon in (
+            (self.type_button, self.parent.icon_type),
+            (self.hint_button, self.parent.icon_hint),
+            (self.show_button, self.parent.icon_show),
+            (self.definition_button, self.parent.icon_definition),
+            (self.change_word_button, self.parent.icon_change),
+            (self.wikipedia_button, self.parent.icon_wikipedia),
+            (self.youtube_button, self.parent.icon_youtube),
+        ):
+            if icon is not None:
+                button.config(image=icon, compound=tk.LEFT)
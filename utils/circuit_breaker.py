@@ -0,0 +1,91 @@
+import threading
+import time
+
+# Échecs consécutifs avant d'ouvrir le circuit
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Durée pendant laquelle les requêtes sont refusées avant une requête d'essai (en secondes)
+DEFAULT_COOLDOWN = 30
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur pour un hôte distant.
+
+    Après 'failure_threshold' échecs réseau consécutifs, le circuit s'ouvre :
+    allow() retourne False et les requêtes sont refusées immédiatement au lieu
+    d'attendre leur délai d'expiration. Toutes les 'cooldown' secondes, une
+    requête d'essai est lancée en arrière-plan : probe() (une vraie requête
+    par la session partagée, donc par le même proxy que les autres) retourne
+    True si l'hôte répond, et le circuit se referme. Aucune requête de
+    l'utilisateur n'attend jamais un hôte injoignable. Utilisable depuis
+    plusieurs threads.
+    """
+
+    def __init__(self, host, probe, failure_threshold=DEFAULT_FAILURE_THRESHOLD, cooldown=DEFAULT_COOLDOWN):
+        self.host = host
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.probe_timer = None
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def allow(self):
+        """Indique si une requête vers l'hôte peut être tentée (circuit fermé)."""
+        return self.opened_at is None
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            if self.opened_at is not None:
+                print(f"Connexion à {self.host} rétablie")
+            self._close()
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.opened_at is None and self.failures >= self.failure_threshold:
+                print(f"{self.host} injoignable : requêtes suspendues pendant {self.cooldown} s")
+                self.opened_at = time.monotonic()
+                self._schedule_probe()
+
+    def _close(self):
+        self.opened_at = None
+        if self.probe_timer is not None:
+            self.probe_timer.cancel()
+            self.probe_timer = None
+
+    def _schedule_probe(self):
+        self.probe_timer = threading.Timer(self.cooldown, self._probe)
+        self.probe_timer.daemon = True
+        self.probe_timer.start()
+
+    def _probe(self):
+        try:
+            reachable = self.probe()
+        except Exception:
+            reachable = False
+
+        with self.lock:
+            if self.opened_at is None or self.probe_timer is None:
+                # Circuit refermé ou disjoncteur arrêté pendant l'essai
+                return
+            if reachable:
+                print(f"{self.host} de nouveau joignable")
+                self.failures = 0
+                self._close()
+            else:
+                self._schedule_probe()
+
+    def shutdown(self):
+        """Arrête la requête d'essai en attente (à la fermeture de l'application)."""
+        with self.lock:
+            if self.probe_timer is not None:
+                self.probe_timer.cancel()
+                self.probe_timer = None
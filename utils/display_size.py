@@ -0,0 +1,20 @@
+# Taille d'affichage par défaut des images dans la zone Wikipédia (avant que sa taille réelle soit connue)
+DISPLAY_MAX_SIZE = (400, 400)
+
+# Paliers de taille d'affichage (côté maximal, en pixels) : une image est décodée au plus
+# grand palier qui tient dans la zone, et le cache mémoire garde une entrée par palier
+DISPLAY_SIZE_TIERS = (240, 320, 400, 640, 960, 1280)
+
+
+def display_size_for(width, height):
+    """Palier de taille d'affichage (largeur, hauteur) pour une zone de width x height pixels."""
+    side = DISPLAY_SIZE_TIERS[0]
+    for tier in DISPLAY_SIZE_TIERS:
+        if tier <= min(width, height):
+            side = tier
+    return side, side
+
+
+def covers(stored_size, max_size):
+    """Indique si une image réduite à stored_size suffit pour un affichage à max_size."""
+    return stored_size[0] >= max_size[0] and stored_size[1] >= max_size[1]
@@ -0,0 +1,68 @@
+import multiprocessing
+import os
+import threading
+
+# Les frames plus petites sont redimensionnées dans le thread de décodage
+# (le transfert vers un processus coûterait plus que le redimensionnement)
+MIN_POOL_PIXELS = 200_000
+
+_pool = None
+_pool_failed = False
+_pool_lock = threading.Lock()
+
+
+def resize_rgba(buffer, size, target, resample, reducing_gap):
+    """
+    Redimensionne une frame RGBA brute (octets) dans un processus du pool.
+    Retourne les octets RGBA bruts de la frame à la taille 'target'.
+    """
+    from PIL import Image
+
+    image = Image.frombuffer("RGBA", size, buffer, "raw", "RGBA", 0, 1)
+    return image.resize(target, resample, reducing_gap=reducing_gap).tobytes()
+
+
+def pool_workers():
+    """Processus du pool : un par cœur, moins celui du thread Tk."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def get_frame_pool():
+    """
+    Pool de processus partagé pour redimensionner les frames de GIF (hors GIL),
+    créé au premier appel ; None s'il ne peut pas être créé.
+    """
+    global _pool, _pool_failed
+    with _pool_lock:
+        if _pool is None and not _pool_failed:
+            from concurrent.futures import ProcessPoolExecutor
+
+            try:
+                # "spawn" partout : pas de fork d'un processus qui a Tk et des threads
+                _pool = ProcessPoolExecutor(
+                    max_workers=pool_workers(),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            except (OSError, NotImplementedError, ImportError) as e:
+                print(f"Pool de processus indisponible, redimensionnement dans le thread : {e}")
+                _pool_failed = True
+        return _pool
+
+
+def disable_frame_pool():
+    """Renonce au pool (processus tué, pool cassé) : les frames seront redimensionnées dans le thread."""
+    global _pool, _pool_failed
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        _pool_failed = True
+
+
+def shutdown_frame_pool():
+    """Arrête le pool sans attendre les frames en cours (à la fermeture de l'application)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
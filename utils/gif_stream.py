@@ -0,0 +1,75 @@
+import io
+import queue
+import threading
+
+from utils.display_size import DISPLAY_MAX_SIZE
+from utils.frame_pool import disable_frame_pool, get_frame_pool
+
+# Fin de l'animation (ou erreur de décodage) dans la file d'un GifFrameStream
+END_OF_STREAM = object()
+
+# Intervalle de vérification de l'arrêt quand la file est pleine (en secondes)
+STOP_POLL_INTERVAL = 0.1
+
+
+class GifFrameStream:
+    """
+    Décode les frames d'un GIF dans un thread, au plus 'window' frames d'avance.
+
+    source : chemin, ou octets du GIF. Les grandes frames sont redimensionnées
+    dans le pool de processus (utils.frame_pool). Les frames (PIL RGBA, déjà à
+    max_size) sont récupérées sans attendre par poll() depuis le thread Tk, qui
+    reste seul à créer les PhotoImage. La file bornée limite la mémoire : le
+    décodage se met en pause tant que les frames prêtes n'ont pas été consommées.
+    """
+
+    def __init__(self, source, max_size=DISPLAY_MAX_SIZE, window=8):
+        self.source = source
+        self.max_size = max_size
+        self.queue = queue.Queue(maxsize=max(1, window))
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="gif-stream", daemon=True)
+        self.thread.start()
+
+    def _put(self, item):
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=STOP_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        # Import dans le thread de décodage : PIL n'est pas chargé au démarrage de l'application
+        from concurrent.futures.process import BrokenProcessPool
+        from utils.image_decode import iter_gif_frames
+
+        source = self.source if isinstance(self.source, str) else io.BytesIO(self.source)
+        try:
+            frames = iter_gif_frames(source, self.max_size, pool=get_frame_pool())
+            try:
+                for item in frames:
+                    if not self._put(item):
+                        return
+            finally:
+                frames.close()
+        except BrokenProcessPool as e:
+            print(f"DEBUG: Pool de processus hors service, abandonné : {e}")
+            disable_frame_pool()
+        except Exception as e:
+            print(f"DEBUG: Erreur lors du décodage du GIF: {e}")
+        self._put(END_OF_STREAM)
+
+    def poll(self):
+        """Frame suivante (frame, durée), END_OF_STREAM à la fin, ou None si rien n'est encore prêt."""
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """Arrête le décodage (sans attendre le thread) et libère les frames en attente."""
+        self.stop_event.set()
+        while self.poll() is not None:
+            pass
@@ -0,0 +1,220 @@
+import threading
+from urllib.parse import urlsplit
+
+from utils.image_worker import raise_if_cancelled
+from utils.rate_limit import parse_retry_after
+from utils.circuit_breaker import CircuitBreaker
+
+# User-Agent conforme à la politique de Wikimedia (nom de l'outil + contact), suivi de celui de requests
+USER_AGENT = "AnatoLexic/1.2 (https://github.com/QuentinLACHENAL/AnatoLexic)"
+
+# Délais séparés : établissement de la connexion / lecture de la réponse (en secondes)
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
+
+# Connexions gardées ouvertes par hôte (fr.wikipedia.org, commons, upload.wikimedia.org...)
+POOL_HOSTS = 8
+POOL_CONNECTIONS_PER_HOST = 10
+
+# Nouvelles tentatives après une réponse 429 (trop de requêtes) quand un limiteur est actif
+MAX_RATE_LIMIT_RETRIES = 3
+
+_session = None
+_session_lock = threading.Lock()
+_rate_limiter = None
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+class CircuitOpenError(ConnectionError):
+    """Requête refusée sans accès réseau : l'hôte est considéré injoignable (circuit ouvert)."""
+
+
+def get_session():
+    """
+    Session HTTP partagée par tous les accès réseau de l'application.
+
+    Les connexions TCP/TLS sont réutilisées (keep-alive) avec un pool par hôte,
+    les réponses gzip sont décompressées par requests de façon transparente.
+    requests n'est importé qu'ici, au premier accès réseau (long à charger au démarrage).
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": f"{USER_AGENT} {requests.utils.default_user_agent()}",
+                "Accept-Encoding": "gzip, deflate",
+            })
+            adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_CONNECTIONS_PER_HOST)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _probe_host(origin):
+    """
+    Requête d'essai d'un disjoncteur ouvert (thread d'arrière-plan) : HEAD sur
+    la racine de l'hôte, par la session partagée (proxy compris, sans passer
+    par le disjoncteur). Retourne True si l'hôte répond sans erreur serveur.
+    """
+    response = get_session().head(origin + "/", timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), allow_redirects=False)
+    response.close()
+    return response.status_code < 500
+
+
+def get_breaker(url):
+    """Disjoncteur (utils.circuit_breaker) de l'hôte de url, créé au premier appel."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            origin = f"{parts.scheme}://{parts.netloc}"
+            breaker = CircuitBreaker(host, lambda: _probe_host(origin))
+            _breakers[host] = breaker
+        return breaker
+
+
+def host_available(url):
+    """Indique si une requête vers l'hôte de url peut être tentée (circuit fermé)."""
+    return get_breaker(url).allow()
+
+
+def _guarded_get(url, params, timeout, **kwargs):
+    """Requête GET protégée par le disjoncteur de l'hôte."""
+    breaker = get_breaker(url)
+    if not breaker.allow():
+        raise CircuitOpenError(f"{breaker.host} injoignable (hors ligne ?)")
+
+    session = get_session()
+    # Déjà chargé par get_session()
+    import requests
+
+    try:
+        response = session.get(url, params=params, timeout=timeout, **kwargs)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+        breaker.record_failure()
+        raise
+    # Une erreur serveur compte comme un échec, une réponse 4xx prouve que l'hôte répond
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def set_rate_limiter(limiter):
+    """
+    Limite le débit de toutes les requêtes (voir utils.rate_limit.TokenBucket),
+    ou None pour ne pas le limiter (comportement de l'application).
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def http_get(url, params=None, timeout=None, cancel_token=None, **kwargs):
+    """
+    requests.get via la session partagée.
+    timeout : délai de lecture (le délai de connexion reste CONNECT_TIMEOUT),
+    ou un tuple (connexion, lecture).
+    Après plusieurs échecs réseau consécutifs vers un hôte, les requêtes
+    suivantes lèvent immédiatement CircuitOpenError (voir utils.circuit_breaker).
+    Si un limiteur de débit est actif, chaque requête attend son jeton et une
+    réponse 429 suspend toutes les requêtes le temps indiqué par Retry-After,
+    puis la requête est retentée.
+    """
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    elif not isinstance(timeout, tuple):
+        timeout = (CONNECT_TIMEOUT, timeout)
+
+    limiter = _rate_limiter
+    if limiter is None:
+        return _guarded_get(url, params, timeout, **kwargs)
+
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        limiter.acquire(cancel_token)
+        response = _guarded_get(url, params, timeout, **kwargs)
+        if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+            return response
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        print(f"Limite de débit atteinte ({url}), nouvel essai dans {delay:.0f} s")
+        response.close()
+        limiter.pause(delay)
+
+
+# Taille des morceaux lus lors d'un téléchargement (entre deux vérifications d'annulation)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Octets nécessaires pour reconnaître le format d'un fichier (signature)
+DOWNLOAD_HEAD_SIZE = 16
+
+
+class DownloadRejected(Exception):
+    """Téléchargement interrompu : contenu trop gros ou d'un type inattendu."""
+
+
+def http_download(url, cancel_token=None, timeout=None, max_bytes=None, check_head=None):
+    """
+    Télécharge le contenu de url par morceaux et retourne les octets (bytearray).
+    Si cancel_token (voir utils.image_worker.ImageJob) est annulé pendant le
+    téléchargement, la connexion est fermée et ImageRequestCancelled est levée.
+
+    max_bytes : taille maximale acceptée ; au-delà (Content-Length annoncé ou
+    octets reçus), DownloadRejected est levée sans lire la suite.
+    check_head(head, content_type, content_length) : appelée dès les premiers
+    octets reçus ; lève DownloadRejected pour abandonner le téléchargement
+    (page d'erreur HTML, format non pris en charge...).
+    """
+    raise_if_cancelled(cancel_token)
+
+    response = http_get(url, timeout=timeout, cancel_token=cancel_token, stream=True)
+    try:
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        try:
+            content_length = int(response.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            content_length = None
+        if max_bytes is not None and content_length is not None and content_length > max_bytes:
+            raise DownloadRejected(f"Fichier trop gros ({content_length} octets) : {url}")
+
+        # Un seul tampon, jamais plus grand que max_bytes (pas de copie morceau par morceau)
+        buffer = bytearray()
+        checked = check_head is None
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            raise_if_cancelled(cancel_token)
+            buffer += chunk
+            if max_bytes is not None and len(buffer) > max_bytes:
+                raise DownloadRejected(f"Fichier trop gros (plus de {max_bytes} octets) : {url}")
+            if not checked and len(buffer) >= DOWNLOAD_HEAD_SIZE:
+                check_head(bytes(buffer[:DOWNLOAD_HEAD_SIZE]), content_type, content_length)
+                checked = True
+
+        if not checked:
+            check_head(bytes(buffer), content_type, content_length)
+        return buffer
+    finally:
+        response.close()
+
+
+def close_session():
+    """
+    Ferme les connexions gardées ouvertes et arrête les requêtes d'essai des
+    disjoncteurs, dont l'état est oublié (à la fermeture de l'application).
+    """
+    global _session
+    with _breakers_lock:
+        for breaker in _breakers.values():
+            breaker.shutdown()
+        _breakers.clear()
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,111 @@
+import base64
+import json
+import os
+import struct
+import tkinter as tk
+
+# Atlas des icônes de l'interface (construit par build_icon_atlas.py), dans le dossier des icônes
+ICON_ATLAS_FILE = "icons_atlas.png"
+
+# Côté (en pixels) des icônes dans l'atlas : leur taille d'affichage sur les boutons
+ICON_SIZE = 64
+
+# Icônes par ligne de l'atlas
+ATLAS_COLUMNS = 8
+
+# Mot-clé du bloc texte (tEXt) du PNG qui contient le manifeste : nom -> [x, y, largeur, hauteur]
+MANIFEST_KEY = "anatolexic-icons"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def read_png_text(data, key):
+    """
+    Texte du bloc tEXt 'key' d'un PNG (octets), ou None s'il n'y en a pas.
+    Lit seulement les en-têtes des blocs : les pixels ne sont pas décodés.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return None
+    offset = len(PNG_SIGNATURE)
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack_from(">I4s", data, offset)
+        start = offset + 8
+        if chunk_type == b"tEXt":
+            keyword, _, text = data[start:start + length].partition(b"\0")
+            if keyword.decode("latin-1") == key:
+                return text.decode("latin-1")
+        elif chunk_type == b"IEND":
+            break
+        # Données du bloc puis CRC (4 octets)
+        offset = start + length + 4
+    return None
+
+
+def build_icon_atlas(paths, size=ICON_SIZE, columns=ATLAS_COLUMNS):
+    """
+    Assemble des icônes (fichiers image) en une seule image RGBA, chacune réduite
+    pour tenir dans size x size. Retourne (atlas PIL, manifeste) ; le nom d'une
+    icône est celui de son fichier, sans extension.
+    """
+    from PIL import Image
+
+    icons = []
+    for path in paths:
+        with Image.open(path) as image:
+            icon = image.convert("RGBA")
+        icon.thumbnail((size, size), Image.Resampling.LANCZOS)
+        icons.append((os.path.splitext(os.path.basename(path))[0], icon))
+
+    columns = max(1, min(columns, len(icons)))
+    rows = (len(icons) + columns - 1) // columns
+    atlas = Image.new("RGBA", (columns * size, max(1, rows) * size), (0, 0, 0, 0))
+    manifest = {}
+    for index, (name, icon) in enumerate(icons):
+        x = (index % columns) * size
+        y = (index // columns) * size
+        atlas.paste(icon, (x, y))
+        manifest[name] = [x, y, icon.size[0], icon.size[1]]
+    return atlas, manifest
+
+
+def write_icon_atlas(path, atlas, manifest):
+    """Écrit l'atlas en PNG, manifeste compris (écriture atomique)."""
+    from PIL.PngImagePlugin import PngInfo
+
+    info = PngInfo()
+    info.add_text(MANIFEST_KEY, json.dumps(manifest, ensure_ascii=True, sort_keys=True))
+    tmp_path = path + ".tmp"
+    atlas.save(tmp_path, format="PNG", pnginfo=info, optimize=True)
+    os.replace(tmp_path, path)
+
+
+def load_icon_atlas(path, master=None):
+    """
+    Lit l'atlas en une seule lecture et le découpe en PhotoImage Tk (sans PIL :
+    Tk décode le PNG lui-même). Retourne un dictionnaire nom -> PhotoImage,
+    vide si l'atlas est absent ou illisible.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        print(f"Atlas d'icônes introuvable ({path}) : icônes chargées une par une, "
+              f"lancer build_icon_atlas.py pour le construire")
+        return {}
+
+    manifest = read_png_text(data, MANIFEST_KEY)
+    if manifest is None:
+        print(f"Atlas d'icônes sans manifeste : {path}")
+        return {}
+
+    try:
+        sheet = tk.PhotoImage(master=master, format="png", data=base64.b64encode(data))
+        icons = {}
+        for name, (x, y, width, height) in json.loads(manifest).items():
+            icon = tk.PhotoImage(master=master, width=width, height=height)
+            icon.tk.call(icon, "copy", sheet, "-from", x, y, x + width, y + height)
+            icons[name] = icon
+        return icons
+    except (tk.TclError, ValueError) as e:
+        print(f"Erreur lors de la lecture de l'atlas d'icônes {path}: {e}")
+        return {}
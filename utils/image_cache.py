@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from utils.resource_utils import user_data_path
+
+# Taille maximale par défaut du cache disque (en octets)
+DEFAULT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Durée par défaut pendant laquelle un terme sans image n'est pas recherché à nouveau
+DEFAULT_NEGATIVE_TTL = 7 * 24 * 3600
+
+# Budget par défaut du cache mémoire d'images décodées (en Mo)
+DEFAULT_MEMORY_CACHE_MB = 64
+
+INDEX_FILE = "index.json"
+
+
+def normalize_term(term):
+    """Clé de cache d'un terme : Unicode NFC, minuscules, espaces normalisés."""
+    term = unicodedata.normalize("NFC", term)
+    return " ".join(term.replace("_", " ").split()).lower()
+
+
+class DiskImageCache:
+    """
+    Cache disque persistant terme -> image prête à afficher.
+
+    Chaque entrée garde le titre de page résolu, l'URL source et les octets
+    de l'image déjà redimensionnée. L'index (index.json) est chargé en mémoire ;
+    quand la taille totale dépasse max_bytes, les entrées les moins récemment
+    utilisées sont supprimées. Les termes sans image sont aussi mémorisés
+    (entrées 'missing'), pendant negative_ttl secondes. Utilisable depuis
+    plusieurs threads.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_MAX_BYTES, negative_ttl=DEFAULT_NEGATIVE_TTL):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.entries = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.directory, INDEX_FILE)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _save_index(self):
+        # Écriture atomique pour ne jamais laisser un index à moitié écrit
+        tmp_path = self._index_path() + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self._index_path())
+        self.dirty = False
+
+    def _blob_path(self, entry):
+        return os.path.join(self.directory, entry["file"])
+
+    def __contains__(self, term):
+        with self.lock:
+            return normalize_term(term) in self.entries
+
+    def get(self, term):
+        """
+        Retourne l'entrée du terme (dict avec 'title', 'url', 'format', 'max_size'
+        et 'data') ou None si le terme n'est pas en cache.
+        """
+        key = normalize_term(term)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry.get("missing"):
+                return None
+            try:
+                with open(self._blob_path(entry), "rb") as f:
+                    data = f.read()
+            except OSError:
+                # Fichier supprimé à la main : oublier l'entrée
+                del self.entries[key]
+                self.dirty = True
+                return None
+            entry["last_access"] = time.time()
+            self.dirty = True
+
+        result = dict(entry)
+        result["data"] = data
+        return result
+
+    def put(self, term, data, max_size, title=None, url=None, image_format=None):
+        """
+        Enregistre les octets (déjà redimensionnés) de l'image d'un terme.
+        max_size est la taille à laquelle l'image a été réduite : l'entrée
+        suffit pour un affichage jusqu'à cette taille.
+        """
+        key = normalize_term(term)
+        file_name = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".bin"
+
+        with self.lock:
+            with open(os.path.join(self.directory, file_name), "wb") as f:
+                f.write(data)
+            self.entries[key] = {
+                "title": title,
+                "url": url,
+                "format": image_format,
+                "max_size": list(max_size),
+                "file": file_name,
+                "size": len(data),
+                "last_access": time.time(),
+            }
+            self._evict()
+            self._save_index()
+
+    def is_missing(self, term):
+        """Indique si le terme est connu comme n'ayant pas d'image (et que ce n'est pas expiré)."""
+        key = normalize_term(term)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or not entry.get("missing"):
+                return False
+            if time.time() - entry["last_access"] > self.negative_ttl:
+                del self.entries[key]
+                self.dirty = True
+                return False
+            return True
+
+    def put_missing(self, term):
+        """Mémorise qu'aucune image n'a été trouvée pour ce terme."""
+        key = normalize_term(term)
+        with self.lock:
+            self._remove_entry(key)
+            self.entries[key] = {"missing": True, "size": 0, "last_access": time.time()}
+            self._save_index()
+
+    def invalidate(self, term):
+        """Oublie tout ce qui est connu sur un terme (image ou absence d'image)."""
+        key = normalize_term(term)
+        with self.lock:
+            if self._remove_entry(key):
+                self._save_index()
+
+    def _remove_entry(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        if "file" in entry:
+            try:
+                os.remove(self._blob_path(entry))
+            except OSError:
+                pass
+        return True
+
+    def _evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes."""
+        total = sum(entry["size"] for entry in self.entries.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if entry.get("missing"):
+                continue
+            total -= entry["size"]
+            self._remove_entry(key)
+
+    def flush(self):
+        """Sauvegarde l'ordre d'utilisation (à appeler à la fermeture)."""
+        with self.lock:
+            if self.dirty:
+                self._save_index()
+
+
+class MemoryImageCache:
+    """
+    LRU en mémoire d'images prêtes à afficher (images PIL décodées ou frames de GIF).
+
+    Les clés sont libres (en pratique (terme normalisé, taille cible)). Chaque
+    entrée déclare son coût en octets ; au-delà de max_megabytes les entrées
+    les moins récemment utilisées sont oubliées. Les PhotoImage ne doivent
+    être créées et lues que depuis le thread Tk.
+    """
+
+    def __init__(self, max_megabytes=DEFAULT_MEMORY_CACHE_MB):
+        self.max_bytes = int(max_megabytes * 1024 * 1024)
+        self.items = OrderedDict()
+        self.total_bytes = 0
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def get(self, key):
+        item = self.items.get(key)
+        if item is None:
+            return None
+        self.items.move_to_end(key)
+        return item[0]
+
+    def put(self, key, value, nbytes):
+        if key in self.items:
+            self.total_bytes -= self.items.pop(key)[1]
+        # Une entrée plus grosse que tout le budget n'est pas gardée
+        if nbytes > self.max_bytes:
+            return
+        self.items[key] = (value, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self.items.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+
+    def discard(self, key):
+        item = self.items.pop(key, None)
+        if item is not None:
+            self.total_bytes -= item[1]
+
+    def clear(self):
+        self.items.clear()
+        self.total_bytes = 0
+
+
+def photo_nbytes(*photos):
+    """Coût mémoire approximatif de PhotoImage Tk (4 octets par pixel)."""
+    return sum(photo.width() * photo.height() * 4 for photo in photos)
+
+
+def image_nbytes(*images):
+    """Coût mémoire approximatif d'images PIL décodées (4 octets par pixel)."""
+    return sum(image.size[0] * image.size[1] * 4 for image in images)
+
+
+_default_cache = None
+
+
+def get_image_cache():
+    """Cache disque partagé par tous les chemins de chargement d'image."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DiskImageCache(user_data_path("image_cache"))
+    return _default_cache
+
+
+def set_image_cache(cache):
+    """Remplace le cache partagé (par exemple pour changer sa taille maximale)."""
+    global _default_cache
+    _default_cache = cache
@@ -0,0 +1,218 @@
+import io
+from collections import deque
+from PIL import Image
+
+from utils.display_size import DISPLAY_MAX_SIZE
+from utils.http_client import DownloadRejected
+from utils.frame_pool import MIN_POOL_PIXELS, pool_workers, resize_rgba
+
+# Taille maximale d'une image téléchargée (les miniatures Wikimedia font quelques centaines de Ko)
+MAX_DOWNLOAD_BYTES = 15 * 1024 * 1024
+
+# Les TIFF (scans non compressés) ne sont acceptés que s'ils annoncent une petite taille
+MAX_TIFF_BYTES = 5 * 1024 * 1024
+
+# Nombre maximal de pixels décodés pour une image (environ 100 Mo en RGBA)
+MAX_DECODE_PIXELS = 25_000_000
+
+# Un JPEG est décodé réduit à au moins DRAFT_MARGIN fois la taille cible, pour garder
+# de la marge au filtre final
+DRAFT_MARGIN = 2
+
+# Réduction entière préalable (Image.reduce) tant que l'image dépasse REDUCING_GAP fois la cible
+REDUCING_GAP = 2.0
+
+
+# Durée d'une frame de GIF sans durée (ou plus courte que GIF_MIN_DURATION), en ms
+GIF_DEFAULT_DURATION = 100
+GIF_MIN_DURATION = 20
+
+
+class ImageTooLarge(ValueError):
+    """Image dont le décodage dépasserait le budget de pixels (MAX_DECODE_PIXELS)."""
+
+
+# Signatures (premiers octets) des formats que PIL décode
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+    (b"BM", "BMP"),
+    (b"II*\x00", "TIFF"),
+    (b"MM\x00*", "TIFF"),
+)
+
+
+def sniff_image_format(head):
+    """Format d'après les premiers octets d'un fichier ('JPEG', 'PNG'...), ou None si inconnu."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    for signature, image_format in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return image_format
+    return None
+
+
+def check_image_head(head, content_type, content_length):
+    """
+    Vérifie le début d'un téléchargement d'image (voir http_client.http_download) :
+    rejette les pages HTML, les SVG, les formats inconnus et les TIFF trop gros
+    avant d'avoir reçu le reste du fichier.
+    """
+    if content_type in ("text/html", "image/svg+xml") or content_type.startswith("text/"):
+        raise DownloadRejected(f"Type de contenu non pris en charge : {content_type}")
+
+    image_format = sniff_image_format(head)
+    if image_format is None:
+        raise DownloadRejected(f"Format d'image non reconnu (type annoncé : {content_type or 'aucun'})")
+    if image_format == "TIFF" and (content_length is None or content_length > MAX_TIFF_BYTES):
+        raise DownloadRejected(f"TIFF trop gros ou de taille inconnue ({content_length} octets)")
+
+
+def target_size(size, max_size=DISPLAY_MAX_SIZE):
+    """Taille (largeur, hauteur) qui tient dans max_size en gardant les proportions."""
+    width, height = size
+    ratio = min(max_size[0] / width, max_size[1] / height, 1)
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+
+def resample_for_ratio(ratio):
+    """
+    Filtre de rééchantillonnage selon le facteur de réduction : au-delà de
+    quelques fois, un filtre plus court est visuellement équivalent et bien
+    moins coûteux (la réduction entière préalable fait l'essentiel du travail).
+    """
+    if ratio <= 2:
+        return Image.Resampling.LANCZOS
+    if ratio <= 4:
+        return Image.Resampling.BICUBIC
+    return Image.Resampling.BILINEAR
+
+
+def prepare_decode(image, max_size=DISPLAY_MAX_SIZE):
+    """
+    Prépare le décodage d'une image ouverte (pas encore décodée) pour l'afficher dans max_size.
+    Un JPEG est décodé directement réduit (1/2, 1/4 ou 1/8) à au moins DRAFT_MARGIN
+    fois la taille cible. Lève ImageTooLarge si l'image à décoder dépasse MAX_DECODE_PIXELS.
+    """
+    if image.format == 'JPEG':
+        width, height = target_size(image.size, max_size)
+        image.draft(None, (width * DRAFT_MARGIN, height * DRAFT_MARGIN))
+
+    if image.size[0] * image.size[1] > MAX_DECODE_PIXELS:
+        raise ImageTooLarge(f"Image trop grande à décoder : {image.size[0]}x{image.size[1]} pixels")
+
+
+def fit_image(image, max_size=DISPLAY_MAX_SIZE):
+    """Réduit une image préparée par prepare_decode à max_size (nouvelle image)."""
+    size = target_size(image.size, max_size)
+    if size == image.size:
+        image.load()
+        return image
+    # Les images à palette ne se rééchantillonnent qu'au plus proche voisin
+    if image.mode in ('1', 'P'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    ratio = max(image.size[0] / size[0], image.size[1] / size[1])
+    return image.resize(size, resample_for_ratio(ratio), reducing_gap=REDUCING_GAP)
+
+
+def shrink_image_bytes(data, max_size=DISPLAY_MAX_SIZE):
+    """
+    Réduit une image encodée (bytes) à max_size.
+    Les GIF animés ne sont pas ré-encodés (voir iter_gif_frames). Retourne (bytes, format).
+    Une image tronquée lève une exception (elle ne doit pas être mise en cache).
+    """
+    image = Image.open(io.BytesIO(data))
+    source_format = image.format
+
+    # GIF animé : gardé tel quel (les miniatures Wikimedia sont déjà à la bonne
+    # taille), il est décodé et réduit en une seule passe à l'affichage
+    if source_format == 'GIF' and getattr(image, 'is_animated', False):
+        return data, 'GIF'
+
+    # Déjà assez petite : garder les octets d'origine
+    if image.size[0] <= max_size[0] and image.size[1] <= max_size[1]:
+        return data, source_format
+
+    prepare_decode(image, max_size)
+    image = fit_image(image, max_size)
+
+    output = io.BytesIO()
+    if source_format == 'JPEG':
+        image.convert('RGB').save(output, format='JPEG', quality=90)
+        return output.getvalue(), 'JPEG'
+
+    if image.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+        image = image.convert('RGBA')
+    image.save(output, format='PNG')
+    return output.getvalue(), 'PNG'
+
+
+def iter_gif_frames(source, max_size=DISPLAY_MAX_SIZE, pool=None):
+    """
+    Décode un GIF (chemin, BytesIO ou image déjà ouverte) frame par frame, en une
+    seule passe : chaque frame est décodée une fois, composée avec les précédentes
+    selon sa méthode d'élimination (disposal) et sa palette locale par PIL,
+    convertie en RGBA puis réduite une fois à max_size. Aucun ré-encodage.
+    pool : ProcessPoolExecutor (voir utils.frame_pool) ; les grandes frames y sont
+    redimensionnées en parallèle, sous forme d'octets RGBA bruts.
+    Ne touche pas à Tk. Produit des (frame PIL RGBA, durée en ms), dans l'ordre.
+    """
+    gif = source if isinstance(source, Image.Image) else Image.open(source)
+    if gif.format != 'GIF':
+        raise ValueError("Le fichier n'est pas un GIF")
+    if gif.size[0] * gif.size[1] > MAX_DECODE_PIXELS:
+        raise ImageTooLarge(f"GIF trop grand à décoder : {gif.size[0]}x{gif.size[1]} pixels")
+
+    size = target_size(gif.size, max_size)
+    frames = _composited_frames(gif)
+    if size == gif.size:
+        yield from frames
+        return
+
+    ratio = max(gif.size[0] / size[0], gif.size[1] / size[1])
+    resample = resample_for_ratio(ratio)
+
+    if pool is None or gif.size[0] * gif.size[1] < MIN_POOL_PIXELS:
+        for frame, duration in frames:
+            yield frame.resize(size, resample, reducing_gap=REDUCING_GAP), duration
+        return
+
+    # Décodage séquentiel ici, redimensionnements en parallèle dans le pool ;
+    # quelques frames d'avance par processus, restituées dans l'ordre
+    pending = deque()
+    try:
+        for frame, duration in frames:
+            future = pool.submit(resize_rgba, frame.tobytes(), frame.size, size, resample, REDUCING_GAP)
+            pending.append((future, duration))
+            if len(pending) >= 2 * pool_workers():
+                future, duration = pending.popleft()
+                yield _rgba_frame(future.result(), size), duration
+        while pending:
+            future, duration = pending.popleft()
+            yield _rgba_frame(future.result(), size), duration
+    finally:
+        # Lecture abandonnée : inutile de finir les frames en attente
+        for future, _ in pending:
+            future.cancel()
+
+
+def _composited_frames(gif):
+    """Frames complètes (RGBA, taille d'origine) et durées d'un GIF, dans l'ordre."""
+    index = 0
+    while True:
+        try:
+            gif.seek(index)
+        except EOFError:
+            return
+        # PIL a déjà appliqué l'élimination de la frame précédente : la frame est complète
+        frame = gif.convert('RGBA')
+        duration = gif.info.get('duration', GIF_DEFAULT_DURATION)
+        # Comme les navigateurs : une durée nulle ou trop courte vaut la durée par défaut
+        yield frame, duration if duration >= GIF_MIN_DURATION else GIF_DEFAULT_DURATION
+        index += 1
+
+
+def _rgba_frame(buffer, size):
+    return Image.frombuffer("RGBA", size, buffer, "raw", "RGBA", 0, 1)
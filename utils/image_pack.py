@@ -0,0 +1,187 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from utils.image_cache import normalize_term
+from utils.resource_utils import resource_path, user_data_path
+
+# Pack d'images hors ligne, livré à côté de l'exécutable (voir build_image_pack.py)
+PACK_FILE = "anatolexic_images.pack"
+
+# Format du fichier :
+#   en-tête   : signature, version, nombre d'entrées
+#   positions : une position absolue (uint32) par entrée d'index, dans l'ordre trié
+#   index     : longueur de la clé (uint16), clé UTF-8 (terme normalisé),
+#               position et longueur de l'image (uint64, uint32), format (8 octets ASCII),
+#               côté maximal auquel l'image a été réduite (uint16)
+#   images    : octets des images, bout à bout
+PACK_MAGIC = b"ALPK"
+PACK_VERSION = 2
+HEADER = struct.Struct("<4sHHI")
+SLOT = struct.Struct("<I")
+KEY_LENGTH = struct.Struct("<H")
+ENTRY = struct.Struct("<QI8sH")
+
+
+def write_image_pack(path, images):
+    """
+    Écrit un pack d'images.
+    images : itérable de (terme, octets, format, max_size), les octets étant
+    déjà réduits à max_size (voir ImageResult.max_size).
+    En cas de doublon, la dernière image d'un terme gagne.
+    Sous Windows, un pack ouvert par l'application (projeté en mémoire) ne
+    peut pas être remplacé : os.replace lève alors PermissionError.
+    """
+    entries = {}
+    for term, data, image_format, max_size in images:
+        entries[normalize_term(term).encode("utf-8")] = (data, (image_format or "").encode("ascii"), max(max_size))
+    # Tri des clés par octets : c'est l'ordre utilisé par la recherche dichotomique
+    keys = sorted(entries)
+
+    index_start = HEADER.size + SLOT.size * len(keys)
+    slots = []
+    position = index_start
+    for key in keys:
+        slots.append(position)
+        position += KEY_LENGTH.size + len(key) + ENTRY.size
+
+    # Écriture dans un fichier temporaire puis renommage : un pack interrompu n'est jamais lu
+    # à moitié. Le renommage n'est possible pendant que l'application a l'ancien pack ouvert
+    # que sous Linux et macOS ; sous Windows, fermer l'application avant de reconstruire le pack
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(keys)))
+        for slot in slots:
+            f.write(SLOT.pack(slot))
+
+        data_position = position
+        for key in keys:
+            data, image_format, side = entries[key]
+            f.write(KEY_LENGTH.pack(len(key)))
+            f.write(key)
+            f.write(ENTRY.pack(data_position, len(data), image_format, side))
+            data_position += len(data)
+
+        for key in keys:
+            f.write(entries[key][0])
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+    return len(keys)
+
+
+class ImagePack:
+    """
+    Pack d'images en lecture seule, projeté en mémoire (mmap).
+
+    L'ouverture ne lit que l'en-tête ; chaque recherche est une dichotomie sur
+    l'index trié, qui ne touche qu'une poignée de pages du fichier. Les octets
+    d'une image ne sont copiés qu'au moment où elle est demandée. Utilisable
+    depuis plusieurs threads.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, _, self.count = HEADER.unpack_from(self.map, 0)
+        except struct.error:
+            magic, version = None, None
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.map.close()
+            raise ValueError(f"Pack d'images invalide : {path}")
+
+    def __len__(self):
+        return self.count
+
+    def _key_at(self, index):
+        position = SLOT.unpack_from(self.map, HEADER.size + SLOT.size * index)[0]
+        length = KEY_LENGTH.unpack_from(self.map, position)[0]
+        start = position + KEY_LENGTH.size
+        return self.map[start:start + length], start + length
+
+    def _find(self, term):
+        """Position de l'entrée d'index du terme, ou None."""
+        key = normalize_term(term).encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            found, entry_position = self._key_at(middle)
+            if found == key:
+                return entry_position
+            if found < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def __contains__(self, term):
+        with self.lock:
+            return self.map is not None and self._find(term) is not None
+
+    def get(self, term):
+        """Retourne {'format', 'data', 'max_size'} pour le terme, ou None s'il n'est pas dans le pack."""
+        with self.lock:
+            if self.map is None:
+                return None
+            entry_position = self._find(term)
+            if entry_position is None:
+                return None
+            offset, length, image_format, side = ENTRY.unpack_from(self.map, entry_position)
+            data = self.map[offset:offset + length]
+        return {"format": image_format.rstrip(b"\0").decode("ascii") or None, "data": data, "max_size": (side, side)}
+
+    def close(self):
+        with self.lock:
+            if self.map is not None:
+                self.map.close()
+                self.map = None
+
+
+def default_pack_paths():
+    """Emplacements du pack, par ordre de priorité : à côté de l'exécutable, puis dossier utilisateur."""
+    if getattr(sys, 'frozen', False):
+        paths = [os.path.join(os.path.dirname(sys.executable), PACK_FILE)]
+    else:
+        paths = [resource_path(PACK_FILE)]
+    paths.append(user_data_path(PACK_FILE))
+    return paths
+
+
+def open_image_pack(path=None):
+    """Ouvre le pack 'path' (ou le premier pack par défaut trouvé) ; None s'il n'y en a pas."""
+    for candidate in ([path] if path else default_pack_paths()):
+        if not os.path.exists(candidate):
+            continue
+        try:
+            return ImagePack(candidate)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de l'ouverture du pack d'images {candidate}: {e}")
+    return None
+
+
+_default_pack = None
+_pack_opened = False
+
+
+def get_image_pack():
+    """Pack d'images partagé (ouvert au premier appel), ou None s'il n'y en a pas."""
+    global _default_pack, _pack_opened
+    if not _pack_opened:
+        _default_pack = open_image_pack()
+        _pack_opened = True
+    return _default_pack
+
+
+def set_image_pack(pack):
+    """Remplace le pack partagé (None pour n'en utiliser aucun)."""
+    global _default_pack, _pack_opened
+    _default_pack = pack
+    _pack_opened = True
@@ -0,0 +1,75 @@
+import random
+
+from utils.image_worker import ImageFetchWorker
+
+
+class SubthemePrefetcher:
+    """
+    Préchauffe les caches d'images pour les mots du sous-thème affiché.
+
+    Les mots sont chargés en arrière-plan (au plus 'concurrency' à la fois et
+    'depth' mots par sous-thème) pendant que l'utilisateur travaille sur le mot
+    courant. Si 'resolve_func' est fourni, il reçoit d'abord la liste des termes
+    pour résoudre leurs URL en lot. Changer de sous-thème annule le
+    préchargement précédent.
+    """
+
+    def __init__(self, tk_root, load_func, on_loaded, concurrency=2, depth=30, resolve_func=None):
+        self.load_func = load_func
+        self.on_loaded = on_loaded
+        self.resolve_func = resolve_func
+        self.depth = depth
+        self.worker = ImageFetchWorker(tk_root, max_workers=concurrency)
+        self.key = None
+        self.jobs = []
+
+    def start(self, key, terms, first=None):
+        """
+        Lance le préchargement des termes du sous-thème 'key'.
+        Sans effet si ce sous-thème est déjà en cours de préchargement.
+        'first' est chargé en priorité (le mot affiché), le reste dans l'ordre
+        aléatoire de tirage de update_word.
+        """
+        if key == self.key:
+            return
+        self.cancel()
+        self.key = key
+
+        order = [term for term in terms if term != first]
+        random.shuffle(order)
+        if first is not None and first in terms:
+            order.insert(0, first)
+
+        order = order[:self.depth]
+        if self.resolve_func is None:
+            self._load_terms(key, order)
+            return
+
+        self.jobs.append(self.worker.submit(
+            self.resolve_func,
+            order,
+            callback=lambda result, error: self._load_terms(key, order)
+        ))
+
+    def _load_terms(self, key, order):
+        # Le sous-thème a changé pendant la résolution en lot
+        if key != self.key:
+            return
+        for term in order:
+            self.jobs.append(self.worker.submit(
+                self.load_func,
+                term,
+                pass_token=True,
+                callback=lambda result, error, term=term: self.on_loaded(term, result, error)
+            ))
+
+    def cancel(self):
+        """Annule tous les préchargements du sous-thème courant (téléchargements en cours compris)."""
+        for job in self.jobs:
+            job.cancel()
+        self.jobs = []
+        self.key = None
+
+    def shutdown(self):
+        self.cancel()
+        self.worker.shutdown()
@@ -0,0 +1,496 @@
+import os
+import threading
+import time
+import unicodedata
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from utils.image_cache import get_image_cache, normalize_term
+from utils.image_pack import get_image_pack
+from utils.display_size import DISPLAY_MAX_SIZE, covers
+from utils.image_decode import MAX_DOWNLOAD_BYTES, ImageTooLarge, check_image_head, shrink_image_bytes
+from utils.http_client import DownloadRejected, http_download, host_available
+from utils.image_strategies import race_strategies
+from utils.image_worker import ImageRequestCancelled, raise_if_cancelled
+from utils.resource_utils import resource_path
+from utils import wikipedia_utils
+
+# Dossier des images fournies avec l'application (prioritaires sur Wikipédia)
+LOCAL_IMAGE_DIR = "images"
+LOCAL_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+
+# Fichiers locaux dont le nom ne se déduit pas directement du terme
+LOCAL_IMAGE_ALIASES = {
+    "humérus": "humerus.jpg",
+    "scapula": "scapula.jpg",
+    "coeur": "coeur.jpg",
+    "poumon": "poumon.jpg",
+}
+
+
+class ImageResult:
+    """
+    Image prête à décoder (octets déjà réduits) et sa provenance.
+    max_size est la taille à laquelle les octets ont été réduits : l'image suffit
+    pour un affichage jusqu'à cette taille (voir utils.display_size.covers).
+    """
+
+    def __init__(self, term, data, title=None, url=None, image_format=None, provider=None, max_size=None):
+        self.term = term
+        self.data = data
+        self.title = title
+        self.url = url
+        self.image_format = image_format
+        self.provider = provider
+        self.max_size = max_size
+
+
+class ImageProvider:
+    """
+    Source d'images pour un terme.
+
+    Un fournisseur local (remote = False) retourne directement un ImageResult
+    depuis lookup(). Un fournisseur distant retourne, via ses stratégies,
+    (titre, URL) : le téléchargement, la réduction et la mise en cache sont
+    faits une seule fois par ImagePipeline, quel que soit le fournisseur.
+    max_size est la taille d'affichage voulue (palier de la zone d'image).
+    """
+
+    name = None
+    remote = False
+
+    def lookup(self, term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        """ImageResult (fournisseur local) ou (titre, URL) (fournisseur distant), None si rien."""
+        raise NotImplementedError
+
+    def available(self):
+        """
+        Indique si le fournisseur peut être interrogé maintenant. Un fournisseur
+        distant dont l'hôte est injoignable (circuit ouvert) est ignoré.
+        """
+        return True
+
+    def strategies(self, term, max_size=DISPLAY_MAX_SIZE):
+        """
+        Liste de (nom, func(cancel_token)) exécutées en parallèle par race_strategies.
+        Un fournisseur peut proposer plusieurs variantes (titre exact, recherche...).
+        """
+        return [(self.name, lambda token: self.lookup(term, token, max_size))]
+
+
+class LocalDirectoryProvider(ImageProvider):
+    """
+    Images fournies avec l'application, dans le dossier 'images'.
+    Le fichier d'un terme est cherché par alias, puis par nom (avec ou sans accents,
+    espaces remplacés par '_'). Aucun accès réseau : c'est le premier fournisseur.
+    Le fichier d'origine est réduit à chaque lecture, à la taille demandée.
+    """
+
+    name = "local"
+
+    def __init__(self, directory=None, aliases=None):
+        self.directory = directory or resource_path(LOCAL_IMAGE_DIR)
+        self.aliases = {normalize_term(term): file_name for term, file_name in (aliases or LOCAL_IMAGE_ALIASES).items()}
+        self.files = None
+
+    def _list_files(self):
+        # Contenu du dossier lu une seule fois : les recherches suivantes ne touchent pas au disque
+        if self.files is None:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                names = []
+            self.files = {name.lower(): name for name in names if name.lower().endswith(LOCAL_IMAGE_EXTENSIONS)}
+        return self.files
+
+    def _candidates(self, term):
+        key = normalize_term(term)
+        if key in self.aliases:
+            yield self.aliases[key].lower()
+        slug = key.replace(" ", "_")
+        ascii_slug = unicodedata.normalize("NFKD", slug).encode("ascii", "ignore").decode("ascii")
+        for base in (key, slug, ascii_slug):
+            for extension in LOCAL_IMAGE_EXTENSIONS:
+                yield base + extension
+
+    def lookup(self, term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        files = self._list_files()
+        if not files:
+            return None
+
+        for candidate in self._candidates(term):
+            if candidate not in files:
+                continue
+            path = os.path.join(self.directory, files[candidate])
+            try:
+                with open(path, "rb") as f:
+                    data, image_format = shrink_image_bytes(f.read(), max_size)
+            except Exception as e:
+                print(f"Erreur avec l'image locale {path}: {e}")
+                continue
+            return ImageResult(term, data, title=files[candidate], url=path,
+                               image_format=image_format, provider=self.name, max_size=max_size)
+        return None
+
+
+class ImagePackProvider(ImageProvider):
+    """Images du pack hors ligne (voir utils.image_pack), lues via mmap sans accès réseau."""
+
+    name = "pack"
+
+    def lookup(self, term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        pack = get_image_pack()
+        if pack is None:
+            return None
+        packed = pack.get(term)
+        if packed is None:
+            return None
+        return ImageResult(term, packed["data"], title=term, url=pack.path,
+                           image_format=packed["format"], provider=self.name, max_size=packed["max_size"])
+
+
+class DiskCacheProvider(ImageProvider):
+    """Images déjà téléchargées, dans le cache disque partagé (voir utils.image_cache)."""
+
+    name = "cache"
+
+    def lookup(self, term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        cached = get_image_cache().get(term)
+        if cached is None:
+            return None
+        return ImageResult(term, cached["data"], title=cached["title"], url=cached["url"],
+                           image_format=cached["format"], provider=self.name, max_size=tuple(cached["max_size"]))
+
+
+class WikipediaPageImagesProvider(ImageProvider):
+    """
+    Image principale (prop=pageimages) de la page Wikipédia du terme.
+    Utilise l'URL déjà résolue en lot s'il y en a une ; sinon le titre exact
+    et la recherche plein texte sont essayés en même temps.
+    """
+
+    name = "wikipedia"
+    remote = True
+
+    def available(self):
+        return host_available(wikipedia_utils.WIKIPEDIA_API_URL)
+
+    def strategies(self, term, max_size=DISPLAY_MAX_SIZE):
+        resolved = wikipedia_utils.get_resolved_image(term, max_size)
+        if resolved is not None:
+            return [("résolution en lot", lambda token: resolved)]
+
+        title = term.replace(" ", "_")
+        if wikipedia_utils.resolution_pending(term, max_size):
+            # Résolution en lot en cours pour ce terme : attendre son résultat plutôt que le doubler
+            return [("résolution en lot", lambda token: self._after_resolution(term, token, max_size))]
+        return [
+            ("titre exact", lambda token: wikipedia_utils.query_page_image(title, token, max_size)),
+            ("recherche", lambda token: self._search(title, token, max_size)),
+        ]
+
+    def _after_resolution(self, term, cancel_token, max_size):
+        wikipedia_utils.wait_for_resolution(term, cancel_token)
+        resolved = wikipedia_utils.get_resolved_image(term, max_size)
+        if resolved is not None:
+            return resolved
+        # Terme absent du lot (pas de page exacte, ou lot en erreur) : titre exact puis recherche
+        title = term.replace(" ", "_")
+        found = wikipedia_utils.query_page_image(title, cancel_token, max_size)
+        return found if found is not None else self._search(title, cancel_token, max_size)
+
+    def _search(self, term, cancel_token, max_size):
+        page_title = wikipedia_utils.search_page_title(term, cancel_token)
+        if page_title is None:
+            return None
+        print(f"DEBUG: Page trouvée via recherche : {page_title}")
+        return wikipedia_utils.query_page_image(page_title, cancel_token, max_size)
+
+    def lookup(self, term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        for _, func in self.strategies(term, max_size):
+            found = func(cancel_token)
+            if found is not None:
+                return found
+        return None
+
+
+class CommonsSearchProvider(ImageProvider):
+    """Recherche de fichiers anatomiques sur Wikimedia Commons (dernier recours)."""
+
+    name = "commons"
+    remote = True
+
+    def available(self):
+        return host_available(wikipedia_utils.COMMONS_API_URL)
+
+    def lookup(self, term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        return wikipedia_utils.search_commons_image(term, cancel_token, max_size)
+
+
+class ProviderStats:
+    """Compteurs d'un fournisseur : appels, images trouvées, échecs, erreurs et temps cumulé."""
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    def __str__(self):
+        average = self.seconds / self.calls * 1000 if self.calls else 0
+        return (f"{self.calls} appels, {self.hits} trouvées, {self.misses} absentes, "
+                f"{self.errors} erreurs, {average:.0f} ms en moyenne")
+
+
+class ImagePipeline:
+    """
+    Chaîne de fournisseurs d'images utilisée par toutes les recherches.
+
+    Les fournisseurs locaux sont interrogés d'abord, dans l'ordre ; puis, si le
+    terme n'est pas connu comme sans image, les stratégies de tous les
+    fournisseurs distants sont lancées ensemble (race_strategies), la mieux
+    classée l'emportant. Les fournisseurs distants dont l'hôte est injoignable
+    (circuit ouvert, voir utils.circuit_breaker) sont ignorés ; l'absence
+    d'image n'est alors pas mémorisée, faute d'avoir pu les interroger.
+
+    L'image gagnante est téléchargée en miniature Wikimedia, au plus petit
+    palier de miniature qui couvre la taille d'affichage demandée (voir
+    wikipedia_utils.thumbnail_size_for), puis mise en cache disque avec cette
+    taille. Une image locale plus petite que la taille demandée (zone d'image
+    agrandie depuis sa mise en cache) déclenche le téléchargement d'une plus
+    grande ; elle n'est affichée telle quelle que si la recherche en ligne
+    n'aboutit pas. Chaque fournisseur est chronométré (voir stats_report).
+
+    Une seule recherche à la fois par terme et par taille : un appel pour un
+    terme déjà en cours de chargement (préchargement, mot suivant préparé,
+    affichage) attend le résultat de la recherche en cours au lieu d'en lancer
+    une seconde.
+    """
+
+    def __init__(self, providers):
+        self.providers = list(providers)
+        self.stats = {}
+        self.stats_lock = threading.Lock()
+        # Recherches en cours : (terme normalisé, taille) -> Future de l'ImageResult
+        self.inflight = {}
+        self.inflight_lock = threading.Lock()
+
+    def _record(self, name, outcome, seconds):
+        with self.stats_lock:
+            stats = self.stats.setdefault(name, ProviderStats())
+            stats.calls += 1
+            stats.seconds += seconds
+            if outcome == "hit":
+                stats.hits += 1
+            elif outcome == "miss":
+                stats.misses += 1
+            else:
+                stats.errors += 1
+
+    def _timed(self, name, func):
+        """Enveloppe func(cancel_token) pour alimenter les statistiques de 'name'."""
+        def timed(cancel_token):
+            start = time.perf_counter()
+            try:
+                result = func(cancel_token)
+            except ImageRequestCancelled:
+                raise
+            except Exception:
+                self._record(name, "error", time.perf_counter() - start)
+                raise
+            self._record(name, "hit" if result is not None else "miss", time.perf_counter() - start)
+            return result
+        return timed
+
+    def fetch(self, term, force_refresh=False, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+        """
+        Retourne l'ImageResult de 'term' pour un affichage à max_size, ou None
+        si aucun fournisseur n'a d'image. force_refresh oublie ce qui est connu
+        du terme (cache disque, cache négatif, URL résolue) avant la recherche.
+        Lève ImageRequestCancelled si cancel_token est annulé.
+        """
+        if force_refresh:
+            return self._fetch(term, True, cancel_token, max_size)
+
+        key = (normalize_term(term), tuple(max_size))
+        with self.inflight_lock:
+            flight = self.inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self.inflight[key] = Future()
+
+        if not owner:
+            print(f"DEBUG: Chargement de '{term}' déjà en cours, attente de son résultat")
+            try:
+                return self._wait_inflight(flight, cancel_token)
+            except ImageRequestCancelled:
+                # Recherche en cours abandonnée par son demandeur : la reprendre, sauf si c'est nous qui abandonnons
+                raise_if_cancelled(cancel_token)
+                return self.fetch(term, force_refresh, cancel_token, max_size)
+
+        try:
+            result = self._fetch(term, False, cancel_token, max_size)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self.inflight_lock:
+                self.inflight.pop(key, None)
+
+    @staticmethod
+    def _wait_inflight(flight, cancel_token):
+        """Résultat de la recherche en cours 'flight', en restant annulable par cancel_token."""
+        while True:
+            raise_if_cancelled(cancel_token)
+            try:
+                return flight.result(timeout=0.1)
+            except FutureTimeoutError:
+                continue
+
+    def _fetch(self, term, force_refresh, cancel_token, max_size):
+        cache = get_image_cache()
+        if force_refresh:
+            cache.invalidate(term)
+            wikipedia_utils.forget_resolved_image(term)
+
+        smaller = None
+        for provider in self.providers:
+            if provider.remote:
+                continue
+            raise_if_cancelled(cancel_token)
+            try:
+                result = self._timed(provider.name, lambda token: provider.lookup(term, token, max_size))(cancel_token)
+            except ImageRequestCancelled:
+                raise
+            except Exception as e:
+                print(f"DEBUG: Fournisseur '{provider.name}' en erreur : {e}")
+                continue
+            if result is None:
+                continue
+            if covers(result.max_size, max_size):
+                print(f"DEBUG: Image de '{term}' fournie par '{provider.name}' ({result.title})")
+                return result
+            if smaller is None:
+                print(f"DEBUG: Image de '{term}' trop petite chez '{provider.name}', recherche d'une plus grande")
+                smaller = result
+
+        found = self._fetch_remote(term, cache, cancel_token, max_size, known=smaller is not None)
+        return found if found is not None else smaller
+
+    def _fetch_remote(self, term, cache, cancel_token, max_size, known=False):
+        """
+        Recherche en ligne, téléchargement et mise en cache. 'known' indique
+        qu'une image plus petite du terme existe déjà : une recherche qui
+        n'aboutit pas ne le mémorise alors pas comme sans image.
+        """
+        # Terme déjà cherché récemment sans succès
+        if cache.is_missing(term):
+            print(f"DEBUG: Aucune image connue pour '{term}' (cache négatif)")
+            return None
+
+        strategies = []
+        skipped = []
+        remote_providers = [provider for provider in self.providers if provider.remote]
+        for provider in remote_providers:
+            if not provider.available():
+                skipped.append(provider.name)
+                continue
+            for label, func in provider.strategies(term, max_size):
+                strategies.append((f"{provider.name}/{label}", self._timed(provider.name, func)))
+        if not strategies:
+            if remote_providers:
+                # Hors ligne : pas d'attente, et rien n'est mémorisé comme absent
+                print(f"DEBUG: Wikipédia injoignable, pas de recherche en ligne pour '{term}'")
+            return None
+        if skipped:
+            print(f"DEBUG: Fournisseurs injoignables ignorés pour '{term}' : {', '.join(skipped)}")
+
+        print(f"DEBUG: Recherche d'image pour '{term}'")
+        name, found, errors = race_strategies(strategies, cancel_token)
+        if found is None:
+            print("DEBUG: Aucune image trouvée")
+            # Ne mémoriser l'absence d'image que si tous les fournisseurs ont répondu sans erreur
+            if not (errors or skipped or known):
+                cache.put_missing(term)
+            return None
+
+        title, img_url = found
+        print(f"DEBUG: URL de l'image trouvée ({name}) : {img_url}")
+        return self._download(term, title, img_url, name.split("/")[0], cancel_token, max_size, known)
+
+    def _download(self, term, title, img_url, provider_name, cancel_token, max_size, known=False):
+        """
+        Télécharge l'image, la réduit au palier de miniature demandé pour
+        max_size et la met en cache disque avec cette taille. Une image
+        inutilisable (refusée ou trop grande à décoder) est mémorisée dans le
+        cache négatif, sauf si 'known' (voir _fetch_remote).
+        """
+        step = wikipedia_utils.thumbnail_size_for(max_size)
+        stored_size = (step, step)
+        start = time.perf_counter()
+        try:
+            # Téléchargement abandonné dès le premier morceau s'il ne s'agit pas d'une image décodable
+            content = http_download(img_url, cancel_token, max_bytes=MAX_DOWNLOAD_BYTES, check_head=check_image_head)
+            # L'original est téléchargé quand il n'y a pas de miniature : le réduire aussi
+            data, image_format = shrink_image_bytes(content, stored_size)
+        except ImageRequestCancelled:
+            raise
+        except (DownloadRejected, ImageTooLarge) as e:
+            # Réponse définitive : la retélécharger à chaque affichage donnerait le même résultat
+            print(f"DEBUG: Image de '{term}' inutilisable : {e}")
+            self._record("téléchargement", "miss", time.perf_counter() - start)
+            if not known:
+                get_image_cache().put_missing(term)
+            return None
+        except Exception as e:
+            print(f"DEBUG: Erreur lors du téléchargement de l'image : {e}")
+            self._record("téléchargement", "error", time.perf_counter() - start)
+            return None
+        self._record("téléchargement", "hit", time.perf_counter() - start)
+
+        try:
+            get_image_cache().put(term, data, stored_size, title=title, url=img_url, image_format=image_format)
+        except OSError as e:
+            print(f"DEBUG: Impossible d'écrire dans le cache : {e}")
+
+        return ImageResult(term, data, title=title, url=img_url, image_format=image_format,
+                           provider=provider_name, max_size=stored_size)
+
+    def stats_report(self):
+        """Résumé texte des statistiques, une ligne par fournisseur."""
+        with self.stats_lock:
+            return "\n".join(f"{name} : {stats}" for name, stats in self.stats.items())
+
+
+def default_providers():
+    """Chaîne par défaut : dossier local, pack hors ligne, cache disque, Wikipédia, puis Commons."""
+    return [
+        LocalDirectoryProvider(),
+        ImagePackProvider(),
+        DiskCacheProvider(),
+        WikipediaPageImagesProvider(),
+        CommonsSearchProvider(),
+    ]
+
+
+_default_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_image_pipeline():
+    """Chaîne de fournisseurs partagée par tous les chemins de chargement d'image."""
+    global _default_pipeline
+    with _pipeline_lock:
+        if _default_pipeline is None:
+            _default_pipeline = ImagePipeline(default_providers())
+        return _default_pipeline
+
+
+def set_image_pipeline(pipeline):
+    """Remplace la chaîne partagée (par exemple pour changer l'ordre des fournisseurs)."""
+    global _default_pipeline
+    with _pipeline_lock:
+        _default_pipeline = pipeline
@@ -0,0 +1,68 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from utils.image_worker import CancelToken, ImageRequestCancelled
+
+# Stratégies exécutées en parallèle, toutes recherches confondues
+MAX_STRATEGY_WORKERS = 8
+
+# Intervalle de vérification de l'annulation de la recherche globale (en secondes)
+CANCEL_POLL_INTERVAL = 0.1
+
+_executor = ThreadPoolExecutor(max_workers=MAX_STRATEGY_WORKERS, thread_name_prefix="image-strategy")
+
+
+def race_strategies(strategies, cancel_token=None):
+    """
+    Exécute plusieurs stratégies de recherche d'image en parallèle.
+
+    strategies : liste ordonnée de (nom, func), de la plus fiable à la moins
+    fiable ; func(cancel_token) retourne un résultat, ou None si la stratégie
+    n'a rien trouvé, et lève une exception en cas d'erreur (réseau...).
+
+    Le résultat de la stratégie la mieux classée qui réussit est retenu dès que
+    toutes les stratégies mieux classées ont échoué ; les autres sont alors
+    annulées. Le délai est donc celui de la stratégie gagnante, pas la somme.
+
+    Retourne (nom, résultat, erreurs) ; nom et résultat valent None si aucune
+    stratégie n'a abouti, erreurs est la liste des exceptions rencontrées.
+    """
+    tokens = [CancelToken(parent=cancel_token) for _ in strategies]
+    futures = [
+        _executor.submit(func, token)
+        for (_, func), token in zip(strategies, tokens)
+    ]
+    outcomes = [None] * len(strategies)  # ("ok", résultat) / ("none", None) / ("error", exception)
+    errors = []
+
+    try:
+        pending = set(futures)
+        while pending:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures.index(future)
+                try:
+                    result = future.result()
+                    outcomes[index] = ("ok", result) if result is not None else ("none", None)
+                except ImageRequestCancelled:
+                    outcomes[index] = ("none", None)
+                except Exception as e:
+                    print(f"DEBUG: Stratégie '{strategies[index][0]}' en erreur : {e}")
+                    outcomes[index] = ("error", e)
+                    errors.append(e)
+
+            # Gagnant : première stratégie réussie dont toutes les précédentes ont échoué
+            for index, outcome in enumerate(outcomes):
+                if outcome is None:
+                    break
+                if outcome[0] == "ok":
+                    return strategies[index][0], outcome[1], errors
+
+        return None, None, errors
+    finally:
+        # Abandonner les stratégies plus lentes (ou toutes si la recherche est annulée)
+        for token, future in zip(tokens, futures):
+            token.cancel()
+            future.cancel()
@@ -0,0 +1,141 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ImageRequestCancelled(Exception):
+    """Levée dans le worker quand la requête d'image a été abandonnée."""
+
+
+def raise_if_cancelled(cancel_token):
+    """Lève ImageRequestCancelled si le jeton (éventuellement None) a été annulé."""
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+
+
+class CancelToken:
+    """
+    Jeton d'annulation partagé entre le thread Tk et le worker.
+    Un jeton enfant est annulé en même temps que son parent.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        if self.cancel_event.is_set():
+            return True
+        return self.parent is not None and self.parent.cancelled
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise ImageRequestCancelled()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class ImageJob(CancelToken):
+    """
+    Tâche de chargement d'image soumise au worker.
+
+    'generation' identifie le mot pour lequel la tâche a été lancée ; la tâche
+    sert aussi de jeton d'annulation, que la fonction exécutée peut consulter
+    (raise_if_cancelled) pour abandonner un téléchargement en cours.
+    """
+
+    def __init__(self, func, args, kwargs, callback, generation=None):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.callback = callback
+        self.generation = generation
+        self.future = None
+
+    def cancel(self):
+        """Annule la tâche : son résultat ne sera jamais transmis au callback."""
+        super().cancel()
+        if self.future is not None:
+            self.future.cancel()
+
+
+class ImageFetchWorker:
+    """
+    Exécute les recherches / téléchargements / décodages d'images hors du thread Tk.
+
+    Les tâches tournent dans un ThreadPoolExecutor et déposent leur résultat
+    dans une file. Le thread Tk vide cette file avec after() et appelle les
+    callbacks : seul le code du callback (création des PhotoImage) touche à Tk.
+    """
+
+    def __init__(self, tk_root, max_workers=2, poll_interval=50):
+        self.tk_root = tk_root
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-fetch")
+        self.results = queue.Queue()
+        self.pending = 0
+        self.poll_id = None
+        self.closed = False
+
+    def submit(self, func, *args, callback=None, generation=None, pass_token=False, **kwargs):
+        """
+        Lance func(*args, **kwargs) dans le pool.
+        callback(result, error) sera appelé dans le thread Tk, sauf si la tâche est annulée.
+        Avec pass_token=True, func reçoit aussi la tâche en argument cancel_token.
+        """
+        job = ImageJob(func, args, kwargs, callback, generation)
+        if pass_token:
+            kwargs["cancel_token"] = job
+        if self.closed:
+            job.cancel()
+            return job
+        job.future = self.executor.submit(self._run, job)
+        job.future.add_done_callback(lambda f: f.cancelled() and self.results.put((job, None, None)))
+        self.pending += 1
+        self._schedule_poll()
+        return job
+
+    def _run(self, job):
+        if job.cancelled:
+            self.results.put((job, None, None))
+            return
+        try:
+            result = job.func(*job.args, **job.kwargs)
+            self.results.put((job, result, None))
+        except Exception as e:
+            self.results.put((job, None, e))
+
+    def _schedule_poll(self):
+        if self.poll_id is None and not self.closed:
+            self.poll_id = self.tk_root.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        self.poll_id = None
+        while True:
+            try:
+                job, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if job.cancelled or job.callback is None:
+                continue
+            try:
+                job.callback(result, error)
+            except Exception as e:
+                print(f"DEBUG: Erreur dans le callback de chargement d'image: {e}")
+        if self.pending > 0:
+            self._schedule_poll()
+
+    def shutdown(self):
+        """Arrête le pool sans attendre les téléchargements en cours."""
+        self.closed = True
+        if self.poll_id is not None:
+            try:
+                self.tk_root.after_cancel(self.poll_id)
+            except Exception:
+                pass
+            self.poll_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
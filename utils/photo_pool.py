@@ -0,0 +1,65 @@
+def photo_mode(image):
+    """
+    Mode des pixels d'une PhotoImage créée depuis l'image PIL 'image',
+    déterminé comme le fait ImageTk.PhotoImage.
+    """
+    from PIL import Image
+
+    mode = image.mode
+    if mode == "P":
+        # Image à palette : c'est le mode de la palette (transparence comprise) qui compte
+        image.apply_transparency()
+        mode = image.palette.mode if image.palette else "RGB"
+    if mode not in ("1", "L", "RGB", "RGBA"):
+        mode = Image.getmodebase(mode)
+    return mode
+
+
+class PhotoPool:
+    """
+    Réserve de PhotoImage Tk réutilisables, classées par taille et par mode.
+
+    acquire() remplit une PhotoImage libre de même taille et de même mode avec
+    les pixels d'une image PIL (paste, sans recréer d'image Tk), ou en crée une.
+    Le mode compte : paste convertit les pixels dans le mode d'origine de la
+    PhotoImage (une image couleur collée dans une PhotoImage 'L' deviendrait
+    grise, une image RGBA perdrait sa transparence dans une PhotoImage 'RGB').
+    release() la rend à la réserve ; au-delà de 'max_free' PhotoImage libres,
+    elle est simplement abandonnée et l'image Tk est détruite aussitôt (plus
+    aucune référence). Aucun gc.collect() n'est donc nécessaire. Thread Tk uniquement.
+    """
+
+    def __init__(self, max_free=8):
+        self.max_free = max_free
+        self.free = {}
+        self.free_count = 0
+
+    def acquire(self, image):
+        """PhotoImage affichant l'image PIL 'image'."""
+        from PIL import ImageTk
+
+        key = (image.size, photo_mode(image))
+        photos = self.free.get(key)
+        if photos:
+            photo = photos.pop()
+            self.free_count -= 1
+            photo.paste(image)
+            return photo
+        photo = ImageTk.PhotoImage(image)
+        # Clé de la réserve : seules les PhotoImage créées ici peuvent y retourner
+        photo.pool_key = key
+        return photo
+
+    def release(self, *photos):
+        """Rend des PhotoImage qui ne sont plus affichées ni gardées ailleurs."""
+        for photo in photos:
+            key = getattr(photo, "pool_key", None)
+            if key is None or self.free_count >= self.max_free:
+                continue
+            self.free.setdefault(key, []).append(photo)
+            self.free_count += 1
+
+    def clear(self):
+        """Détruit toutes les PhotoImage libres."""
+        self.free.clear()
+        self.free_count = 0
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from utils.image_worker import raise_if_cancelled
+
+# Attente maximale acceptée pour un Retry-After (en secondes)
+MAX_RETRY_AFTER = 120
+
+# Attente par défaut après un 429 sans Retry-After (en secondes)
+DEFAULT_RETRY_AFTER = 5
+
+
+class TokenBucket:
+    """
+    Limiteur de débit partagé entre threads (seau à jetons).
+
+    'rate' jetons par seconde, au plus 'burst' accumulés : acquire() prend un
+    jeton et attend s'il n'y en a plus. pause() suspend toutes les requêtes
+    jusqu'à une échéance, par exemple après une réponse 429 avec Retry-After.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _wait_time(self):
+        now = time.monotonic()
+        if now < self.paused_until:
+            return self.paused_until - now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def acquire(self, cancel_token=None):
+        """Attend un jeton ; lève ImageRequestCancelled si cancel_token est annulé entre-temps."""
+        while True:
+            raise_if_cancelled(cancel_token)
+            with self.lock:
+                wait = self._wait_time()
+            if wait <= 0:
+                return
+            # Attente par petites tranches pour rester annulable
+            time.sleep(min(wait, 0.1))
+
+    def pause(self, seconds):
+        """Suspend toutes les requêtes pendant 'seconds' secondes (au plus MAX_RETRY_AFTER)."""
+        seconds = min(max(seconds, 0), MAX_RETRY_AFTER)
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+def parse_retry_after(value, default=DEFAULT_RETRY_AFTER):
+    """Délai (en secondes) d'un en-tête Retry-After : nombre de secondes ou date HTTP."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # Import tardif : email.utils est lent à charger et ne sert qu'aux dates HTTP
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return default
@@ -11,3 +11,17 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")  # Changé de ".." à "."
 
     return os.path.join(base_path, relative_path)
+
+
+def user_data_path(*parts):
+    """
+    Returns a writable per-user path for caches and downloaded data
+    (the PyInstaller temp folder is read-only and wiped at exit).
+    """
+    base_path = os.environ.get("LOCALAPPDATA")
+    if base_path:
+        base_path = os.path.join(base_path, "AnatoLexic")
+    else:
+        base_path = os.path.join(os.path.expanduser("~"), ".anatolexic")
+
+    return os.path.join(base_path, *parts)
@@ -0,0 +1,32 @@
+import os
+import time
+
+# Variable d'environnement activant le rapport des phases du démarrage (comme l'option --startup-timing)
+STARTUP_TIMING_ENV = "ANATOLEXIC_STARTUP_TIMING"
+
+_start = time.perf_counter()
+_phases = []
+_enabled = bool(os.environ.get(STARTUP_TIMING_ENV))
+
+
+def enable_startup_timing():
+    global _enabled
+    _enabled = True
+
+
+def startup_phase(name):
+    """Note la fin d'une phase du démarrage (sans effet si le mode n'est pas activé)."""
+    if _enabled:
+        _phases.append((name, time.perf_counter()))
+
+
+def startup_report():
+    """Affiche la durée de chaque phase depuis l'import de ce module (au lancement de main.py)."""
+    if not _enabled or not _phases:
+        return
+    print("Temps de démarrage :")
+    previous = _start
+    for name, moment in _phases:
+        print(f"  {name:<28} {(moment - previous) * 1000:8.1f} ms   (total {(moment - _start) * 1000:8.1f} ms)")
+        previous = moment
+    _phases.clear()
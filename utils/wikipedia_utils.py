@@ -1,200 +1,386 @@
 import io
-import requests
-from PIL import Image, ImageTk
-import tkinter as tk
+import threading
 
+from utils.image_cache import normalize_term
+from utils.display_size import DISPLAY_MAX_SIZE, covers
+from utils.http_client import http_get
+from utils.image_worker import raise_if_cancelled
 
-def fetch_wikipedia_image(search_term):
+WIKIPEDIA_API_URL = "https://fr.wikipedia.org/w/api.php"
+COMMONS_API_URL = "https://commons.wikimedia.org/w/api.php"
+
+# Nombre maximal de titres par requête accepté par l'API MediaWiki
+MAX_TITLES_PER_QUERY = 50
+
+# Largeurs de miniatures déjà générées et mises en cache par les serveurs Wikimedia
+THUMBNAIL_STEPS = (120, 250, 330, 500, 960, 1280, 1920)
+
+# Résultats de resolve_image_urls : terme normalisé -> (titre de page, URL de l'image, palier demandé)
+_resolved_images = {}
+# Résolutions en lot en cours : terme normalisé -> (événement signalé à la fin, palier demandé)
+_pending_resolutions = {}
+_resolved_lock = threading.Lock()
+
+# Attente maximale d'une résolution en lot en cours avant de chercher le terme seul (en secondes)
+RESOLUTION_WAIT_TIMEOUT = 15
+
+
+def fetch_wikipedia_image(search_term, force_refresh=False, cancel_token=None):
     """
     Récupère une image depuis Wikipédia pour le terme de recherche donné.
     Retourne un tuple (img_data, img_url) ou (None, None) si aucune image n'est trouvée.
+    Passe par la même chaîne de fournisseurs (et les mêmes caches) que
+    Application.load_wikipedia_image.
     """
-    print(f"Recherche d'image pour: {search_term}")
+    # Import local : utils.image_providers dépend lui-même de ce module
+    from utils.image_providers import get_image_pipeline
 
-    # Essayons d'abord avec un terme anatomique spécifique
-    anatomical_term = f"{search_term} anatomie"
-    img_data, img_url = try_wikipedia_search(anatomical_term)
+    result = get_image_pipeline().fetch(search_term, force_refresh=force_refresh, cancel_token=cancel_token)
+    if result is None:
+        return None, None
+    return io.BytesIO(result.data), result.url
 
-    # Si ça ne fonctionne pas, essayons le terme original
-    if not img_data:
-        img_data, img_url = try_wikipedia_search(search_term)
 
-    # Si ça ne fonctionne toujours pas, essayons la méthode alternative
-    if not img_data:
-        img_data, img_url = try_alternative_api(search_term)
+def thumbnail_size_for(max_size=DISPLAY_MAX_SIZE):
+    """
+    Taille de miniature à demander au serveur pour un affichage à max_size :
+    le plus petit palier Wikimedia couvrant le plus grand côté de la zone.
+    """
+    needed = max(max_size)
+    for step in THUMBNAIL_STEPS:
+        if step >= needed:
+            return step
+    return THUMBNAIL_STEPS[-1]
 
-    return img_data, img_url
 
+# Formats vectoriels que PIL ne sait pas décoder : il faut le rendu PNG du serveur
+VECTOR_EXTENSIONS = (".svg", ".svgz")
+VECTOR_MIME_TYPES = ("image/svg+xml",)
 
-def try_wikipedia_search(term):
-    """Fonction auxiliaire pour tenter une recherche Wikipedia"""
 
-    # En-têtes pour éviter d'être bloqué par Wikipedia
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-    }
+def is_vector_image(url=None, mime=None):
+    """Indique, d'après les métadonnées de l'API, si l'image est un format vectoriel."""
+    if mime and mime.lower() in VECTOR_MIME_TYPES:
+        return True
+    if url:
+        return url.split("?")[0].lower().endswith(VECTOR_EXTENSIONS)
+    return False
 
-    search_term = term.replace(" ", "_")
-    api_url = "https://fr.wikipedia.org/w/api.php"
 
-    # Paramètres de l'API
+def rasterized_thumb_url(original_url, width):
+    """
+    URL du rendu PNG, calculé par le serveur, d'un fichier SVG hébergé sur upload.wikimedia.org :
+    .../commons/a/ab/Nom.svg -> .../commons/thumb/a/ab/Nom.svg/<width>px-Nom.svg.png
+    Retourne None si l'URL n'a pas la forme attendue.
+    """
+    marker = "upload.wikimedia.org/"
+    if marker not in original_url or "/thumb/" in original_url:
+        return None
+    prefix, path = original_url.split(marker, 1)
+    parts = path.split("/")
+    # wikipedia/<projet>/<x>/<xy>/<fichier>
+    if len(parts) < 5:
+        return None
+    file_name = parts[-1]
+    thumb_path = "/".join(parts[:2] + ["thumb"] + parts[2:])
+    return f"{prefix}{marker}{thumb_path}/{width}px-{file_name}.png"
+
+
+def page_image_url(page_info, max_size=DISPLAY_MAX_SIZE):
+    """
+    URL de la miniature d'une page (prop=pageimages), ou de l'original à défaut.
+    Un original vectoriel (SVG) est remplacé par son rendu PNG côté serveur, à la taille de max_size.
+    """
+    if "thumbnail" in page_info:
+        return page_info["thumbnail"]["source"]
+    if "original" in page_info:
+        img_url = page_info["original"]["source"]
+        if is_vector_image(img_url):
+            return rasterized_thumb_url(img_url, thumbnail_size_for(max_size))
+        return img_url
+    return None
+
+
+def query_page_image(title, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+    """
+    Image de la page Wikipédia 'title' (redirections suivies), en miniature pour un affichage à max_size.
+    Retourne (titre de la page, URL de l'image) ou None ; lève une exception en cas d'erreur réseau.
+    """
     params = {
         "action": "query",
         "format": "json",
         "prop": "pageimages",
-        "piprop": "original",
-        "titles": search_term,
-        "pithumbsize": 500  # Taille de la miniature
+        "piprop": "thumbnail|original",
+        "pithumbsize": thumbnail_size_for(max_size),  # Plus petite miniature qui couvre l'affichage
+        "titles": title,
+        "redirects": 1  # Suivre les redirections
     }
 
-    try:
-        print(f"Envoi de la requête API Wikipedia pour '{term}'...")
-        r = requests.get(api_url, params=params, headers=headers, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-
-        # Débogage: afficher la structure complète de la réponse
-        print(f"Structure de la réponse: {data.keys()}")
-
-        # Vérifiez si la requête a bien retourné des pages
-        if 'query' not in data or 'pages' not in data['query']:
-            print("Aucune page trouvée dans la réponse")
-            return None, None
-
-        pages = data['query']['pages']
-        print(f"Pages trouvées: {len(pages)}")
-
-        for page_id, page_info in pages.items():
-            print(f"Page ID: {page_id}, Titre: {page_info.get('title', 'Sans titre')}")
-
-            # Vérifiez d'abord le thumbnail qui est souvent plus fiable
-            if "thumbnail" in page_info:
-                img_url = page_info["thumbnail"]["source"]
-                print(f"Miniature trouvée: {img_url}")
-
-                try:
-                    img_response = requests.get(img_url, headers=headers, timeout=15)
-                    img_response.raise_for_status()
-
-                    content_type = img_response.headers.get('content-type', '')
-                    print(f"Type de contenu: {content_type}")
-
-                    if content_type.startswith('image'):
-                        img_data = io.BytesIO(img_response.content)
-                        img_data.seek(0)
-                        print("Image miniature téléchargée avec succès")
-                        return img_data, img_url
-                except Exception as e:
-                    print(f"Erreur lors du téléchargement de la miniature: {e}")
-
-            # Ensuite, essayez l'image originale si disponible
-            if "original" in page_info:
-                img_url = page_info["original"]["source"]
-                print(f"Image originale trouvée: {img_url}")
-
-                try:
-                    img_response = requests.get(img_url, headers=headers, timeout=15)
-                    img_response.raise_for_status()
-
-                    content_type = img_response.headers.get('content-type', '')
-                    print(f"Type de contenu: {content_type}")
-
-                    if content_type.startswith('image'):
-                        img_data = io.BytesIO(img_response.content)
-                        img_data.seek(0)
-                        print("Image originale téléchargée avec succès")
-                        return img_data, img_url
-                except Exception as e:
-                    print(f"Erreur lors du téléchargement de l'image originale: {e}")
-
-            print(f"Aucune image ou miniature trouvée pour cette page")
-
-        print("Aucune image n'a pu être récupérée")
-        return None, None
+    raise_if_cancelled(cancel_token)
+    r = http_get(WIKIPEDIA_API_URL, params=params, cancel_token=cancel_token)
+    r.raise_for_status()
+    pages = r.json().get("query", {}).get("pages", {})
 
-    except Exception as e:
-        print(f"Erreur dans la recherche Wikipedia: {e}")
-        return None, None
+    for page_id, page_info in pages.items():
+        if page_id == "-1":
+            continue
+        # Miniature à la taille d'affichage, l'original seulement s'il n'y en a pas
+        img_url = page_image_url(page_info, max_size)
+        if img_url:
+            return page_info.get("title"), img_url
+    return None
+
+
+def search_page_title(term, cancel_token=None):
+    """
+    Titre du premier résultat de la recherche plein texte Wikipédia pour 'term', ou None.
+    Lève une exception en cas d'erreur réseau.
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "list": "search",
+        "srsearch": term,
+        "srlimit": 1,
+        "srprop": ""
+    }
+
+    raise_if_cancelled(cancel_token)
+    r = http_get(WIKIPEDIA_API_URL, params=params, cancel_token=cancel_token)
+    r.raise_for_status()
+    results = r.json().get("query", {}).get("search", [])
+    return results[0]["title"] if results else None
+
+
+# Fichiers Commons hors sujet (imagerie religieuse...) trouvés par la recherche
+COMMONS_IGNORED_WORDS = ('sacre', 'jesus', 'religion', 'church', 'icon', 'bible', 'croix')
+
+
+def search_commons_image(search_term, cancel_token=None, max_size=DISPLAY_MAX_SIZE):
+    """
+    Recherche une image anatomique pertinente sur Wikimedia Commons, en miniature pour un affichage à max_size.
+    Retourne (titre du fichier, URL de l'image) ou None ; lève une exception en cas d'erreur réseau.
+    """
+    # Ajouter des termes anatomiques pour filtrer les résultats
+    anatomical_search = f"{search_term} anatomie OR anatomy OR os OR squelette OR muscle OR organe"
 
+    params = {
+        "action": "query",
+        "format": "json",
+        "list": "search",
+        "srsearch": anatomical_search,
+        "srnamespace": "6",  # Namespace 6 pour les fichiers
+        "srlimit": "5"  # Plusieurs résultats pour avoir plus de chances de trouver une bonne image
+    }
+
+    raise_if_cancelled(cancel_token)
+    r = http_get(COMMONS_API_URL, params=params, cancel_token=cancel_token)
+    r.raise_for_status()
+    results = r.json().get("query", {}).get("search", [])
+
+    file_titles = []
+    for result in results:
+        file_title = result["title"]
+        if any(word in file_title.lower() for word in COMMONS_IGNORED_WORDS):
+            print(f"Ignoré (hors sujet): {file_title}")
+            continue
+        file_titles.append(file_title)
+    if not file_titles:
+        return None
+
+    # Une seule requête imageinfo pour tous les fichiers candidats
+    params = {
+        "action": "query",
+        "format": "json",
+        "titles": "|".join(file_titles),
+        "prop": "imageinfo",
+        "iiprop": "url|mime",
+        "iiurlwidth": thumbnail_size_for(max_size)  # Miniature générée par le serveur
+    }
 
-def try_alternative_api(search_term):
-    """Méthode alternative pour récupérer une image si l'API principale échoue."""
+    raise_if_cancelled(cancel_token)
+    r = http_get(COMMONS_API_URL, params=params, cancel_token=cancel_token)
+    r.raise_for_status()
+    query = r.json().get("query", {})
+
+    renames = {item["from"]: item["to"] for item in query.get("normalized", [])}
+    infos = {}
+    for page_info in query.get("pages", {}).values():
+        if page_info.get("imageinfo"):
+            infos[page_info["title"]] = page_info["imageinfo"][0]
+
+    # Garder l'ordre de pertinence de la recherche
+    for file_title in file_titles:
+        info = infos.get(renames.get(file_title, file_title))
+        if info is None:
+            continue
+        img_url = info.get("thumburl") or info["url"]
+        if is_vector_image(img_url, None if "thumburl" in info else info.get("mime")):
+            # SVG sans rendu PNG disponible : inutile de le télécharger
+            img_url = rasterized_thumb_url(info["url"], thumbnail_size_for(max_size))
+            if not img_url:
+                print(f"Ignoré (format vectoriel): {file_title}")
+                continue
+        return file_title, img_url
+
+    return None
+
+
+def resolve_image_urls(terms, search_missing=True, max_size=DISPLAY_MAX_SIZE):
+    """
+    Résout en lot les images Wikipédia d'une liste de termes (un sous-thème,
+    tout le dictionnaire words...), en miniatures pour un affichage à max_size.
+    Les titres sont envoyés par paquets de 50 dans une même requête pageimages,
+    redirections comprises ; seuls les termes sans page exacte font l'objet
+    d'une recherche individuelle.
+    Retourne un dictionnaire terme -> URL de l'image (termes sans image absents).
+    Pendant la résolution, une recherche de l'un de ces termes peut en attendre
+    le résultat (voir wait_for_resolution) au lieu de lancer ses propres requêtes.
+    """
+    terms = list(dict.fromkeys(terms))
+    events = {}
+    with _resolved_lock:
+        for term in terms:
+            key = normalize_term(term)
+            if key not in _pending_resolutions:
+                events[key] = threading.Event()
+                _pending_resolutions[key] = (events[key], max_size)
     try:
-        print(f"Tentative avec méthode anatomique pour '{search_term}'...")
+        return _resolve_image_urls(terms, search_missing, max_size)
+    finally:
+        with _resolved_lock:
+            for key, event in events.items():
+                if _pending_resolutions.get(key, (None,))[0] is event:
+                    del _pending_resolutions[key]
+                event.set()
+
+
+def _resolve_image_urls(terms, search_missing, max_size):
+    found = {}
+
+    # 1) Titres exacts, par paquets
+    for term, (title, img_url) in _query_page_images(terms, max_size).items():
+        found[term] = (title, img_url)
+
+    # 2) Recherche plein texte pour les termes restants, puis un seul lot pageimages
+    if search_missing:
+        search_titles = {}
+        for term in terms:
+            if term in found:
+                continue
+            try:
+                title = search_page_title(term)
+            except Exception as e:
+                print(f"Erreur lors de la recherche de '{term}': {e}")
+                continue
+            if title:
+                search_titles[term] = title
+
+        by_title = _query_page_images(list(set(search_titles.values())), max_size)
+        for term, title in search_titles.items():
+            if title in by_title:
+                found[term] = by_title[title]
+
+    with _resolved_lock:
+        for term, (title, img_url) in found.items():
+            _resolved_images[normalize_term(term)] = (title, img_url, max_size)
+
+    print(f"Images résolues en lot: {len(found)}/{len(terms)} termes")
+    return {term: img_url for term, (_, img_url) in found.items()}
+
+
+def forget_resolved_image(term):
+    """Oublie l'URL résolue d'un terme (rafraîchissement forcé)."""
+    with _resolved_lock:
+        _resolved_images.pop(normalize_term(term), None)
 
-        # En-têtes pour éviter d'être bloqué
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        }
 
-        # Essayons avec une recherche plus spécifique pour l'anatomie
-        commons_api_url = f"https://commons.wikimedia.org/w/api.php"
+def resolution_pending(term, max_size=DISPLAY_MAX_SIZE):
+    """Indique si une résolution en lot utilisable pour un affichage à max_size est en cours pour 'term'."""
+    with _resolved_lock:
+        pending = _pending_resolutions.get(normalize_term(term))
+    return pending is not None and covers(pending[1], max_size)
 
-        # Ajouter des termes anatomiques pour filtrer les résultats
-        anatomical_search = f"{search_term} anatomie OR anatomy OR os OR squelette OR muscle OR organe"
 
-        commons_params = {
+def wait_for_resolution(term, cancel_token=None, timeout=RESOLUTION_WAIT_TIMEOUT):
+    """
+    Attend la fin de la résolution en lot en cours pour 'term', s'il y en a une
+    (au plus 'timeout' secondes). Lève ImageRequestCancelled si cancel_token est annulé.
+    """
+    with _resolved_lock:
+        pending = _pending_resolutions.get(normalize_term(term))
+    if pending is None:
+        return
+    event = pending[0]
+    # Attente par petites tranches pour rester annulable
+    for _ in range(int(timeout * 10)):
+        raise_if_cancelled(cancel_token)
+        if event.wait(0.1):
+            return
+
+
+def get_resolved_image(term, max_size=DISPLAY_MAX_SIZE):
+    """
+    Retourne (titre, URL) déjà résolu par resolve_image_urls, ou None s'il
+    n'y en a pas, ou si sa miniature est trop petite pour un affichage à max_size.
+    """
+    with _resolved_lock:
+        resolved = _resolved_images.get(normalize_term(term))
+    if resolved is None or not covers(resolved[2], max_size):
+        return None
+    return resolved[:2]
+
+
+def _query_page_images(titles, max_size=DISPLAY_MAX_SIZE):
+    """
+    Interroge prop=pageimages pour plusieurs titres à la fois, en miniatures pour un affichage à max_size.
+    Retourne un dictionnaire titre demandé -> (titre de page résolu, URL de l'image).
+    """
+    results = {}
+
+    for start in range(0, len(titles), MAX_TITLES_PER_QUERY):
+        batch = titles[start:start + MAX_TITLES_PER_QUERY]
+        params = {
             "action": "query",
             "format": "json",
-            "list": "search",
-            "srsearch": anatomical_search,
-            "srnamespace": "6",  # Namespace 6 pour les fichiers
-            "srlimit": "5"  # Augmenter pour avoir plus de chances de trouver une bonne image
+            "prop": "pageimages",
+            "piprop": "thumbnail|original",
+            "pithumbsize": thumbnail_size_for(max_size),
+            "pilimit": "max",
+            "titles": "|".join(batch),
+            "redirects": 1
         }
 
-        r = requests.get(commons_api_url, params=commons_params, headers=headers, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-
-        # Vérifier chaque résultat jusqu'à trouver une bonne image
-        if 'query' in data and 'search' in data['query']:
-            for result in data['query']['search']:
-                file_title = result['title']
-
-                # Filtrer les images religieuses et autres non pertinentes
-                if any(term in file_title.lower() for term in
-                       ['sacre', 'jesus', 'religion', 'church', 'icon', 'bible', 'croix']):
-                    print(f"Ignoré (religieux): {file_title}")
-                    continue
-
-                print(f"Essai avec le fichier: {file_title}")
-
-                # Récupérer l'URL de l'image
-                file_api_url = commons_api_url
-                file_params = {
-                    "action": "query",
-                    "format": "json",
-                    "titles": file_title,
-                    "prop": "imageinfo",
-                    "iiprop": "url"
-                }
-
-                r = requests.get(file_api_url, params=file_params, headers=headers, timeout=15)
-                r.raise_for_status()
-                file_data = r.json()
-
-                pages = file_data.get('query', {}).get('pages', {})
-                for _, page_info in pages.items():
-                    if 'imageinfo' in page_info and len(page_info['imageinfo']) > 0:
-                        img_url = page_info['imageinfo'][0]['url']
-                        print(f"URL d'image trouvée: {img_url}")
-
-                        img_response = requests.get(img_url, headers=headers, timeout=15)
-                        img_response.raise_for_status()
-
-                        img_data = io.BytesIO(img_response.content)
-                        img_data.seek(0)
-                        print("Image alternative téléchargée avec succès")
-                        return img_data, img_url
-
-        print("Aucune image alternative trouvée")
-        return None, None
+        try:
+            r = http_get(WIKIPEDIA_API_URL, params=params, timeout=15)
+            r.raise_for_status()
+            query = r.json().get("query", {})
+        except Exception as e:
+            print(f"Erreur lors de la résolution en lot: {e}")
+            continue
 
-    except Exception as e:
-        print(f"Erreur dans la méthode alternative: {e}")
-        return None, None
+        # Suivre la normalisation puis les redirections : titre demandé -> titre final
+        renames = {}
+        for item in query.get("normalized", []) + query.get("redirects", []):
+            renames[item["from"]] = item["to"]
+
+        images = {}
+        for page_info in query.get("pages", {}).values():
+            img_url = page_image_url(page_info, max_size)
+            if img_url:
+                images[page_info["title"]] = img_url
+
+        for title in batch:
+            final_title = title
+            # Une normalisation peut être suivie d'une redirection
+            for _ in range(3):
+                if final_title not in renames:
+                    break
+                final_title = renames[final_title]
+            if final_title in images:
+                results[title] = (final_title, images[final_title])
+
+    return results
 
 
 def load_gif_animation(source, label, after_func):
@@ -206,6 +392,8 @@ def load_gif_animation(source, label, after_func):
 
     Retourne True en cas de succès, False sinon.
     """
+    from PIL import Image, ImageTk
+
     print(f"Début du chargement de l'animation GIF")
 
     try:
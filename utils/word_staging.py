@@ -0,0 +1,59 @@
+import random
+
+from utils.text_utils import shuffle_preserving_punctuation
+
+
+def pick_word(entries, exclude=()):
+    """
+    Tire une entrée (mot, définition) au hasard dans 'entries',
+    en évitant les mots de 'exclude' tant que c'est possible.
+    """
+    candidates = [entry for entry in entries if entry[0] not in exclude]
+    return random.choice(candidates or entries)
+
+
+def display_letters(word, flashcard):
+    """Lettres affichées pour 'word' : masquées en mode flashcard, mélangées sinon."""
+    if flashcard:
+        return [" " if c == " " else "_" for c in word]
+    return list(shuffle_preserving_punctuation(word))
+
+
+class StagedWord:
+    """
+    Mot préparé à l'avance, pendant que le mot courant est affiché.
+
+    key identifie le contexte du tirage (thème, sous-thème, mode flashcard) :
+    le mot n'est utilisé que si ce contexte n'a pas changé. letters est la
+    chaîne déjà mélangée ou masquée. L'image est chargée par 'job' (tâche du
+    worker d'images) puis gardée dans 'photo' (PhotoImage déjà remplie) ou
+    'result' (("gif", octets)), prête à être affichée sans attente.
+    """
+
+    def __init__(self, key, word, definition, letters):
+        self.key = key
+        self.word = word
+        self.definition = definition
+        self.letters = letters
+        self.photo = None
+        self.result = None
+        self.job = None
+        # L'image a été demandée alors que le chargement était encore en cours
+        self.waiting = False
+
+    @property
+    def loading(self):
+        return self.job is not None and not self.job.cancelled
+
+    def take_photo(self):
+        """Retourne la PhotoImage préparée (ou None) ; elle appartient ensuite à l'appelant."""
+        photo, self.photo = self.photo, None
+        return photo
+
+    def discard(self, photo_pool):
+        """Abandonne le mot préparé : annule son chargement et rend sa PhotoImage à la réserve."""
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        photo_pool.release(self.take_photo())
+        self.result = None
@@ -0,0 +1,168 @@
+"""
+Préchauffe le cache disque des images pour tous les termes de words.py.
+
+Usage :
+    python warm_image_cache.py [--workers 4] [--rate 5] [--burst 5] [--restart]
+                               [--report warm_report.csv] [--checkpoint chemin.json]
+                               [--api-url URL] [--commons-url URL]
+
+Les recherches passent par la chaîne de fournisseurs de l'application, avec
+au plus --workers termes traités à la fois et au plus --rate requêtes HTTP par
+seconde (toutes requêtes confondues). Une réponse 429 suspend toutes les
+requêtes pendant le délai Retry-After. La progression est enregistrée dans le
+fichier de reprise : relancer le script reprend là où il s'était arrêté (les
+termes en erreur sont retentés). Le pack hors ligne est ignoré, et les
+termes déjà fournis par le dossier images/ sont signalés 'local' : rien n'est
+téléchargé pour eux. --api-url et --commons-url permettent de viser un
+serveur local de test à la place de Wikimédia.
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from build_image_pack import all_terms
+from utils import wikipedia_utils
+from utils.image_cache import get_image_cache
+from utils.image_pack import set_image_pack
+from utils.image_providers import get_image_pipeline
+from utils.http_client import close_session, set_rate_limiter
+from utils.rate_limit import TokenBucket
+from utils.resource_utils import user_data_path
+
+CHECKPOINT_FILE = "warm_checkpoint.json"
+REPORT_FILE = "warm_report.csv"
+REPORT_FIELDS = ["term", "status", "provider", "bytes", "latency_ms", "error"]
+
+# Sauvegarde de la progression tous les N termes
+CHECKPOINT_EVERY = 20
+
+# Fournisseurs sans accès réseau : leurs images ne réchauffent pas le cache disque
+LOCAL_PROVIDERS = ("local", "pack")
+
+
+def load_checkpoint(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_checkpoint(path, rows):
+    # Écriture atomique : une interruption ne doit pas corrompre la reprise
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def warm_term(term, refresh=False):
+    """
+    Cherche l'image d'un terme et retourne sa ligne de rapport.
+    status : 'hit' (image en cache disque), 'local' (image fournie sans accès
+    réseau, rien à mettre en cache), 'miss' (aucune image) ou 'error'.
+    """
+    start = time.perf_counter()
+    row = {"term": term, "status": "error", "provider": "", "bytes": 0, "latency_ms": 0, "error": ""}
+    try:
+        result = get_image_pipeline().fetch(term, force_refresh=refresh)
+        if result is not None and result.provider in LOCAL_PROVIDERS:
+            row.update(status="local", provider=result.provider)
+        elif result is not None:
+            row.update(status="hit", provider=result.provider, bytes=len(result.data))
+        elif get_image_cache().is_missing(term):
+            row["status"] = "miss"
+        else:
+            # Rien de mémorisé comme absent : une requête ou le téléchargement a échoué
+            row["error"] = "échec réseau ou téléchargement"
+    except Exception as e:
+        row["error"] = str(e)
+    row["latency_ms"] = round((time.perf_counter() - start) * 1000)
+    return row
+
+
+def write_report(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def warm_terms(terms, checkpoint, workers=4, refresh=False, restart=False):
+    """
+    Traite les termes pas encore faits d'après le fichier de reprise 'checkpoint'
+    (tous si restart) et y enregistre la progression.
+    Retourne le dictionnaire terme -> ligne de rapport, reprise comprise.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint)), exist_ok=True)
+    done = {} if restart else load_checkpoint(checkpoint)
+    # Les termes en erreur sont retentés à la reprise
+    done = {term: row for term, row in done.items() if row["status"] != "error"}
+
+    terms = [term for term in terms if term not in done]
+    print(f"{len(done)} termes déjà traités, {len(terms)} à traiter")
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(warm_term, term, refresh) for term in terms]
+        for count, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            done[row["term"]] = row
+            print(f"[{count}/{len(terms)}] {row['term']} : {row['status']} "
+                  f"{row['provider']} {row['bytes']} octets {row['latency_ms']} ms {row['error']}")
+            if count % CHECKPOINT_EVERY == 0:
+                save_checkpoint(checkpoint, done)
+    except KeyboardInterrupt:
+        print("Interrompu : la progression est enregistrée, relancer pour reprendre")
+    finally:
+        # Ne pas attendre les termes restants en cas d'interruption
+        executor.shutdown(wait=False, cancel_futures=True)
+        save_checkpoint(checkpoint, done)
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Préchauffe le cache d'images d'AnatoLexic.")
+    parser.add_argument("--workers", type=int, default=4, help="termes traités simultanément")
+    parser.add_argument("--rate", type=float, default=5, help="requêtes HTTP par seconde")
+    parser.add_argument("--burst", type=float, default=None, help="requêtes accumulables (par défaut : --rate)")
+    parser.add_argument("--checkpoint", default=user_data_path(CHECKPOINT_FILE), help="fichier de reprise")
+    parser.add_argument("--report", default=REPORT_FILE, help="rapport CSV par terme")
+    parser.add_argument("--restart", action="store_true", help="ignorer la progression enregistrée")
+    parser.add_argument("--refresh", action="store_true", help="ignorer le cache disque et tout retélécharger")
+    parser.add_argument("--api-url", help="URL de l'API Wikipédia (serveur de test)")
+    parser.add_argument("--commons-url", help="URL de l'API Commons (serveur de test)")
+    args = parser.parse_args()
+
+    if args.api_url:
+        wikipedia_utils.WIKIPEDIA_API_URL = args.api_url
+    if args.commons_url:
+        wikipedia_utils.COMMONS_API_URL = args.commons_url
+    set_rate_limiter(TokenBucket(args.rate, args.burst))
+    # Le pack court-circuiterait la recherche en ligne : c'est le cache disque qu'il faut remplir
+    set_image_pack(None)
+
+    start = time.perf_counter()
+    try:
+        done = warm_terms(all_terms(), args.checkpoint, args.workers, args.refresh, args.restart)
+    finally:
+        get_image_cache().flush()
+        close_session()
+
+    rows = list(done.values())
+    write_report(args.report, rows)
+
+    statuses = ("hit", "local", "miss", "error")
+    totals = {status: sum(1 for row in rows if row["status"] == status) for status in statuses}
+    size = sum(row["bytes"] for row in rows)
+    print(f"{totals['hit']} images, {totals['local']} locales, {totals['miss']} sans image, "
+          f"{totals['error']} erreurs, {size / 1024 / 1024:.1f} Mo en {time.perf_counter() - start:.0f} s ; "
+          f"rapport : {args.report}")
+
+
+if __name__ == "__main__":
+    main()